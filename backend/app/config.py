@@ -1,7 +1,7 @@
 """Configuration settings for FabFlow Studio backend."""
 import os
 from functools import lru_cache
-from pydantic_settings import BaseSettings
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
 class Settings(BaseSettings):
@@ -11,6 +11,24 @@ class Settings(BaseSettings):
     openai_api_key: str = ""
     bria_api_key: str = ""
     
+    # FIBO API settings
+    fibo_max_concurrency: int = 8  # max in-flight generations per client
+    fibo_max_retries: int = 3
+    fibo_base_delay: float = 1.0  # seconds, doubled per retry
+    fibo_max_delay: float = 10.0  # seconds, cap on a single retry delay
+    fibo_poll_interval: float = 5.0  # seconds, cap on the status poll backoff
+    fibo_max_poll_time: float = 60.0  # seconds to wait for a generation
+    fibo_auth_failure_ttl: float = 300.0  # seconds calls fail fast after a 401
+    frame_concurrency: int = 5  # concurrent scene generations per storyboard
+    
+    # Video compositing
+    compositor_concurrency: int = 2  # concurrent ffmpeg runs across all jobs
+    
+    # Job storage
+    job_ttl: float = 3600.0  # seconds a finished job's state is kept
+    job_sweep_interval: float = 300.0  # seconds between expiry sweeps
+    job_max_finished: int = 1000  # finished jobs kept; oldest evicted beyond this
+    
     # CORS settings
     frontend_url: str = "http://localhost:3000"
     
@@ -18,9 +36,12 @@ class Settings(BaseSettings):
     host: str = "0.0.0.0"
     port: int = 8000
     
-    class Config:
-        env_file = ".env"
-        env_file_encoding = "utf-8"
+    # Frozen: settings are read once at startup and shared, never mutated
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        env_file_encoding="utf-8",
+        frozen=True,
+    )
 
 
 @lru_cache()
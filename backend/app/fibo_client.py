@@ -6,21 +6,157 @@ Handles communication with Bria's FIBO API including:
 - Error handling and retries
 """
 import asyncio
+import hashlib
 import httpx
+import importlib.util
 import logging
-from functools import wraps
-from typing import Optional, TypeVar, Callable, Any, TYPE_CHECKING
+import orjson
+import random
+import re
+import time
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from functools import lru_cache, partial, wraps
+from types import MappingProxyType
+from typing import Optional, TypeVar, Callable, Any, Iterator, Union, TYPE_CHECKING
+from cachetools import TTLCache
 from pydantic import BaseModel
 
 from app.config import get_settings
 
 if TYPE_CHECKING:
     from app.fibo_translator import FIBOStructuredPromptV2
+    from app.models import FIBOPrompt
 
 logger = logging.getLogger(__name__)
 
+# Settings are immutable and cached, so read them once at import
+settings = get_settings()
+
 T = TypeVar("T")
 
+# 1-based attempt number of the with_retry call running in this task
+_retry_attempt: ContextVar[int] = ContextVar("fibo_retry_attempt", default=1)
+
+# HTTP/2 needs the optional h2 package (httpx[http2]); fall back to HTTP/1.1 without it
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# Timeouts (seconds) for generation requests and status checks
+REQUEST_TIMEOUT = 120.0
+STATUS_TIMEOUT = 30.0
+
+# Seconds the status endpoint may hold a long-poll request open, and the
+# response time above which we treat a poll as held by the server
+LONG_POLL_WAIT = 30
+LONG_POLL_HELD = 1.0
+
+# Leading bytes of a status response searched for the "status" field
+STATUS_PEEK_BYTES = 256
+_STATUS_PEEK = re.compile(rb'"status"\s*:\s*"([^"]+)"')
+_TERMINAL_STATUSES = frozenset({b"completed", b"failed"})
+
+# Upper bound (seconds) of random jitter added to each poll delay
+POLL_JITTER = 0.1
+
+# Rate-limit and transient server statuses that status polls wait out
+TRANSIENT_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+RATE_LIMIT_STATUS_CODES = frozenset({429, 503})
+TRANSIENT_MAX_DELAY = 8.0
+
+# Static fields of the lifestyle-shot payload, shared read-only across requests
+LIFESTYLE_SHOT_TEMPLATE = MappingProxyType({"sync": True})
+
+# Text-to-image result cache: max entries and time-to-live in seconds
+RESULT_CACHE_SIZE = 512
+RESULT_CACHE_TTL = 600
+
+
+@lru_cache(maxsize=32)
+def _text_to_image_tail(num_results: int, aspect_ratio: str) -> bytes:
+    """Pre-encode the static part of a text-to-image request body.
+    
+    Returns the JSON fields that follow "prompt", so a full body is
+    b'{"prompt":' + orjson.dumps(prompt) + tail.
+    """
+    static_fields = orjson.dumps({
+        "num_results": num_results,
+        "aspect_ratio": aspect_ratio,
+        "sync": True  # Use sync mode for simpler response handling
+    })
+    return b"," + static_fields[1:]
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header given in seconds or as an HTTP-date.
+    
+    Returns:
+        Non-negative seconds to wait, or None if the header is missing or invalid.
+    """
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+
+def _transient_delay(response: httpx.Response, attempt: int) -> float:
+    """Seconds to wait before retrying a transient (429/5xx) response.
+    
+    Honors the Retry-After header, otherwise backs off exponentially
+    with jitter. Both are capped at TRANSIENT_MAX_DELAY.
+    """
+    retry_after = _parse_retry_after(response.headers.get("Retry-After"))
+    if retry_after is not None:
+        return min(retry_after, TRANSIENT_MAX_DELAY)
+    return min(2 ** attempt + random.random(), TRANSIENT_MAX_DELAY)
+
+
+def _text_to_image_body(prompt: str, num_results: int, aspect_ratio: str) -> bytes:
+    """Encode a text-to-image request body around the pre-encoded static tail."""
+    return b'{"prompt":' + orjson.dumps(prompt) + _text_to_image_tail(num_results, aspect_ratio)
+
+
+def _extract_sync_result(data: dict) -> Optional[tuple[str, str]]:
+    """Extract (request_id, image_url) from a completed FIBO response.
+    
+    Returns:
+        The first result's uuid and image URL, or None if the response
+        carries no result yet.
+    """
+    try:
+        # API returns 'urls' array, not 'url'
+        first = data["result"][0]
+        return first.get("uuid", "sync-request"), first["urls"][0]
+    except (KeyError, IndexError, TypeError):
+        return None
+
+
+def _poll_schedule(initial: float, cap: float) -> Iterator[float]:
+    """Yield status poll delays, growing 1.5x from initial up to cap.
+    
+    Fast jobs are checked again quickly, while long-running jobs settle at
+    one check every cap seconds.
+    """
+    delay = initial
+    while True:
+        yield delay
+        delay = min(delay * 1.5, cap)
+
+
+def _result_cache_key(prompt: str, aspect_ratio: str, num_results: int) -> str:
+    """Build the result cache key for a text-to-image request."""
+    return hashlib.blake2b(
+        f"{prompt}|{aspect_ratio}|{num_results}".encode(),
+        digest_size=16
+    ).hexdigest()
+
 
 class FIBOError(Exception):
     """Base exception for FIBO API errors."""
@@ -44,7 +180,36 @@ class FIBOAPIError(FIBOError):
     
     def __init__(self, message: str, status_code: Optional[int] = None):
         self.status_code = status_code
-        super().__init__(message, code="FIBO_API_ERROR", retryable=status_code != 401)
+        # Client errors won't succeed on retry, except rate limiting (429)
+        retryable = not (
+            status_code is not None and 400 <= status_code < 500 and status_code != 429
+        )
+        super().__init__(message, code="FIBO_API_ERROR", retryable=retryable)
+
+
+class FIBORateLimitError(FIBOAPIError):
+    """Raised when FIBO API rate limits or sheds load (429/503).
+    
+    Attributes:
+        retry_after: Seconds the server asked us to wait, if it said.
+    """
+    
+    def __init__(
+        self,
+        message: str,
+        status_code: int = 429,
+        retry_after: Optional[float] = None
+    ):
+        self.retry_after = retry_after
+        super().__init__(message, status_code=status_code)
+        self.code = "FIBO_RATE_LIMITED"
+
+
+class FIBOCircuitOpenError(FIBOError):
+    """Raised without calling the API while its circuit breaker is open."""
+    
+    def __init__(self, message: str = "FIBO API circuit open, failing fast"):
+        super().__init__(message, code="FIBO_CIRCUIT_OPEN", retryable=False)
 
 
 class FIBORetryExhaustedError(FIBOError):
@@ -63,7 +228,11 @@ def with_retry(
     """Decorator for adding retry logic with exponential backoff to async functions.
     
     Retries failed FIBO requests up to max_retries times with exponential backoff.
-    Only retries errors that are marked as retryable.
+    Each delay is drawn uniformly from [0, backoff] (full jitter) so parallel
+    scene generations that fail together don't retry in lockstep, except
+    after a rate limit that carries Retry-After, which is honored instead.
+    Only retries errors that are marked as retryable. The running attempt
+    number is kept in _retry_attempt for per-call metrics.
     
     Args:
         max_retries: Maximum number of retry attempts (default 3 per Requirement 4.3).
@@ -81,6 +250,7 @@ def with_retry(
             last_error: Optional[Exception] = None
             
             for attempt in range(max_retries + 1):  # +1 for initial attempt
+                _retry_attempt.set(attempt + 1)
                 try:
                     return await func(*args, **kwargs)
                 except FIBOError as e:
@@ -89,25 +259,29 @@ def with_retry(
                     # Don't retry non-retryable errors (e.g., 401 auth errors)
                     if not e.retryable:
                         logger.warning(
-                            f"FIBO request failed with non-retryable error: {e.message}"
+                            "FIBO request failed with non-retryable error: %s", e.message
                         )
                         raise
                     
                     # Don't retry if we've exhausted all attempts
                     if attempt >= max_retries:
                         logger.error(
-                            f"FIBO request failed after {max_retries} retries: {e.message}"
+                            "FIBO request failed after %d retries: %s", max_retries, e.message
                         )
                         raise FIBORetryExhaustedError(
                             f"Failed after {max_retries} retries: {e.message}",
                             last_error=e
                         )
                     
-                    # Calculate exponential backoff delay
-                    delay = min(base_delay * (2 ** attempt), max_delay)
+                    if isinstance(e, FIBORateLimitError) and e.retry_after is not None:
+                        # The server told us when to come back
+                        delay = min(e.retry_after, max_delay)
+                    else:
+                        # Exponential backoff with full jitter so concurrent retries spread out
+                        delay = random.uniform(0, min(base_delay * (2 ** attempt), max_delay))
                     logger.warning(
-                        f"FIBO request failed (attempt {attempt + 1}/{max_retries + 1}): "
-                        f"{e.message}. Retrying in {delay:.1f}s..."
+                        "FIBO request failed (attempt %d/%d): %s. Retrying in %.1fs...",
+                        attempt + 1, max_retries + 1, e.message, delay
                     )
                     await asyncio.sleep(delay)
                     
@@ -117,18 +291,18 @@ def with_retry(
                     # Don't retry if we've exhausted all attempts
                     if attempt >= max_retries:
                         logger.error(
-                            f"FIBO request failed after {max_retries} retries: {str(e)}"
+                            "FIBO request failed after %d retries: %s", max_retries, e
                         )
                         raise FIBORetryExhaustedError(
                             f"Failed after {max_retries} retries: {str(e)}",
                             last_error=e
                         )
                     
-                    # Calculate exponential backoff delay
-                    delay = min(base_delay * (2 ** attempt), max_delay)
+                    # Exponential backoff with full jitter so concurrent retries spread out
+                    delay = random.uniform(0, min(base_delay * (2 ** attempt), max_delay))
                     logger.warning(
-                        f"FIBO request failed (attempt {attempt + 1}/{max_retries + 1}): "
-                        f"{str(e)}. Retrying in {delay:.1f}s..."
+                        "FIBO request failed (attempt %d/%d): %s. Retrying in %.1fs...",
+                        attempt + 1, max_retries + 1, e, delay
                     )
                     await asyncio.sleep(delay)
             
@@ -142,6 +316,191 @@ def with_retry(
     return decorator
 
 
+def _is_server_error(response: httpx.Response) -> bool:
+    """Whether a FIBO response indicates the API itself is failing."""
+    return response.status_code >= 500
+
+
+class CircuitBreaker:
+    """Circuit breaker that fails fast while the FIBO API is down.
+    
+    CLOSED passes calls through and counts consecutive failures. After
+    fail_threshold failures it trips OPEN and rejects calls for reset_timeout
+    seconds, then goes HALF_OPEN and lets a single probe through: success
+    closes the circuit, failure opens it again.
+    
+    Attributes:
+        state: Current state (CLOSED, OPEN or HALF_OPEN).
+        fail_count: Consecutive failures since the last success.
+        opened_at: time.monotonic() when the circuit last opened.
+    """
+    
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+    
+    def __init__(
+        self,
+        fail_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        is_failure: Optional[Callable[[Any], bool]] = None
+    ):
+        """Initialize circuit breaker.
+        
+        Args:
+            fail_threshold: Consecutive failures that trip the circuit.
+            reset_timeout: Seconds to stay OPEN before probing again.
+            is_failure: Optional predicate marking a returned result as a
+                failure (e.g. a 5xx response). Raised exceptions always are.
+        """
+        self.fail_threshold = fail_threshold
+        self.reset_timeout = reset_timeout
+        self.is_failure = is_failure
+        self.state = self.CLOSED
+        self.fail_count = 0
+        self.opened_at = 0.0
+        self._probing = False
+    
+    def is_open(self) -> bool:
+        """Check whether calls are currently being rejected, without side effects."""
+        return (
+            self.state == self.OPEN
+            and time.monotonic() - self.opened_at < self.reset_timeout
+        )
+    
+    def allow(self) -> bool:
+        """Check whether a call may proceed, moving OPEN to HALF_OPEN when due.
+        
+        Returns:
+            True if the call may go ahead, False to fail fast.
+        """
+        if self.state == self.CLOSED:
+            return True
+        if self.state == self.OPEN:
+            if time.monotonic() - self.opened_at < self.reset_timeout:
+                return False
+            self.state = self.HALF_OPEN
+        # Half-open: only one probe at a time
+        if self._probing:
+            return False
+        self._probing = True
+        return True
+    
+    def record_success(self) -> None:
+        """Close the circuit after a successful call."""
+        self.state = self.CLOSED
+        self.fail_count = 0
+        self._probing = False
+    
+    def record_failure(self) -> None:
+        """Count a failed call, opening the circuit at the threshold."""
+        self._probing = False
+        self.fail_count += 1
+        if self.state == self.HALF_OPEN or self.fail_count >= self.fail_threshold:
+            if self.state != self.OPEN:
+                logger.warning(
+                    "FIBO circuit opened after %d consecutive failures", self.fail_count
+                )
+            self.state = self.OPEN
+            self.opened_at = time.monotonic()
+    
+    async def call(self, coro_fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Run coro_fn through the breaker.
+        
+        Args:
+            coro_fn: Async callable to run.
+            *args: Positional arguments for coro_fn.
+            **kwargs: Keyword arguments for coro_fn.
+            
+        Returns:
+            The result of coro_fn.
+            
+        Raises:
+            FIBOCircuitOpenError: If the circuit is open.
+        """
+        if not self.allow():
+            raise FIBOCircuitOpenError()
+        try:
+            result = await coro_fn(*args, **kwargs)
+        except Exception:
+            self.record_failure()
+            raise
+        except BaseException:
+            # Cancelled: free the probe slot without judging the API
+            self._probing = False
+            raise
+        
+        if self.is_failure is not None and self.is_failure(result):
+            self.record_failure()
+        else:
+            self.record_success()
+        return result
+
+
+class EndpointPool:
+    """Bulkhead for one FIBO endpoint family.
+    
+    Each pool has its own HTTP connection pool, concurrency limit and
+    circuit breaker, so a slow or failing endpoint can't exhaust capacity
+    used by the others.
+    
+    Attributes:
+        sem: Limits in-flight generations on this endpoint.
+        breaker: Circuit breaker for this endpoint.
+    """
+    
+    def __init__(
+        self,
+        max_concurrency: int,
+        transport: Optional[httpx.AsyncBaseTransport] = None
+    ):
+        """Initialize endpoint pool.
+        
+        Args:
+            max_concurrency: Maximum in-flight generations on this endpoint.
+            transport: Optional httpx transport replacing the built-in pool.
+                The pool owns it and closes it in aclose(), so it must not
+                be shared with another pool.
+        """
+        self.sem = asyncio.Semaphore(max_concurrency)
+        self.breaker = CircuitBreaker(is_failure=_is_server_error)
+        self._transport = transport
+        self._http_client: Optional[httpx.AsyncClient] = None
+    
+    def get_client(self) -> httpx.AsyncClient:
+        """Get or create this pool's HTTP client.
+        
+        The client keeps a keep-alive connection pool so subsequent requests
+        skip the TCP and TLS handshake, and speaks HTTP/2 (when h2 is
+        installed) so concurrent generations and status polls multiplex over
+        a single connection.
+        
+        A custom transport replaces the built-in pool, so the HTTP/2 and pool
+        limits settings don't apply to it.
+        
+        Returns:
+            Pooled httpx.AsyncClient instance.
+        """
+        if self._http_client is None or self._http_client.is_closed:
+            self._http_client = httpx.AsyncClient(
+                timeout=REQUEST_TIMEOUT,
+                transport=self._transport,
+                http2=HTTP2_AVAILABLE,
+                limits=httpx.Limits(
+                    max_connections=20,
+                    max_keepalive_connections=20,
+                    keepalive_expiry=60.0
+                )
+            )
+        return self._http_client
+    
+    async def aclose(self) -> None:
+        """Close the HTTP client and release pooled connections."""
+        if self._http_client is not None:
+            await self._http_client.aclose()
+            self._http_client = None
+
+
 class FIBOGenerationResult(BaseModel):
     """Result from FIBO image generation."""
     
@@ -150,6 +509,32 @@ class FIBOGenerationResult(BaseModel):
     status: str = "completed"
 
 
+# Map camera angle to FIBO format
+CAMERA_ANGLE_MAP = {
+    "close-up": "close_up",
+    "medium-shot": "medium_shot",
+    "wide-shot": "wide_shot",
+    "overhead": "overhead",
+    "low-angle": "low_angle"
+}
+
+# Map lighting style to FIBO format
+LIGHTING_MAP = {
+    "soft": "soft",
+    "dramatic": "dramatic",
+    "natural": "natural",
+    "studio": "studio",
+    "golden-hour": "golden_hour"
+}
+
+# Map subject position to FIBO composition format
+POSITION_MAP = {
+    "center": "center",
+    "rule-of-thirds-left": "rule_of_thirds_left",
+    "rule-of-thirds-right": "rule_of_thirds_right"
+}
+
+
 class FIBOStructuredPrompt(BaseModel):
     """Structured prompt format for FIBO API.
     
@@ -187,43 +572,19 @@ class FIBOStructuredPrompt(BaseModel):
         Returns:
             FIBOStructuredPrompt ready for API submission.
         """
-        # Map camera angle to FIBO format
-        camera_angle_map = {
-            "close-up": "close_up",
-            "medium-shot": "medium_shot",
-            "wide-shot": "wide_shot",
-            "overhead": "overhead",
-            "low-angle": "low_angle"
-        }
-        
-        # Map lighting style to FIBO format
-        lighting_map = {
-            "soft": "soft",
-            "dramatic": "dramatic",
-            "natural": "natural",
-            "studio": "studio",
-            "golden-hour": "golden_hour"
-        }
-        
-        # Map subject position to FIBO composition format
-        position_map = {
-            "center": "center",
-            "rule-of-thirds-left": "rule_of_thirds_left",
-            "rule-of-thirds-right": "rule_of_thirds_right"
-        }
-        
-        return cls(
+        # All fields are built here from known-good values, so skip validation
+        return cls.model_construct(
             scene_description=prompt,
             camera={
-                "angle": camera_angle_map.get(camera_angle, camera_angle.replace("-", "_")),
-                "shot_type": camera_angle_map.get(camera_angle, "medium_shot")
+                "angle": CAMERA_ANGLE_MAP.get(camera_angle, camera_angle.replace("-", "_")),
+                "shot_type": CAMERA_ANGLE_MAP.get(camera_angle, "medium_shot")
             },
             lighting={
-                "style": lighting_map.get(lighting_style, lighting_style.replace("-", "_")),
+                "style": LIGHTING_MAP.get(lighting_style, lighting_style.replace("-", "_")),
                 "intensity": "medium"
             },
             composition={
-                "subject_position": position_map.get(subject_position, "center"),
+                "subject_position": POSITION_MAP.get(subject_position, "center"),
                 "framing": "standard"
             },
             style={
@@ -238,13 +599,7 @@ class FIBOStructuredPrompt(BaseModel):
         Returns:
             Dictionary ready for JSON serialization to FIBO API.
         """
-        return {
-            "scene_description": self.scene_description,
-            "camera": self.camera,
-            "lighting": self.lighting,
-            "composition": self.composition,
-            "style": self.style
-        }
+        return self.model_dump()
 
 
 class FIBOClient:
@@ -254,21 +609,31 @@ class FIBOClient:
     
     Attributes:
         BASE_URL: Base URL for FIBO API endpoints.
-        POLL_INTERVAL: Seconds between status polls.
+        POLL_INITIAL_DELAY: Seconds before the second status poll.
+        POLL_INTERVAL: Maximum seconds between status polls.
         MAX_POLL_TIME: Maximum seconds to wait for completion.
     """
     
     BASE_URL = "https://engine.prod.bria-api.com"
-    POLL_INTERVAL = 2  # seconds between polls (per Requirement 7.2)
-    MAX_POLL_TIME = 60  # maximum polling time in seconds
+    POLL_INITIAL_DELAY = 0.5  # first backoff step; grows 1.5x per poll
+    POLL_INTERVAL = settings.fibo_poll_interval  # backoff cap between polls
+    MAX_POLL_TIME = settings.fibo_max_poll_time  # maximum polling time in seconds
     
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        transport_factory: Optional[Callable[[], httpx.AsyncBaseTransport]] = None
+    ):
         """Initialize FIBO client.
         
         Args:
             api_key: FIBO API key. If not provided, reads from settings.
+            transport_factory: Optional callable returning a new httpx
+                transport, e.g. an aiohttp-backed transport for
+                high-concurrency workloads. It is called once per endpoint
+                pool so the pools never share connections. Defaults to
+                httpx's built-in HTTP/2 pool.
         """
-        settings = get_settings()
         self.api_key = api_key or settings.bria_api_key
         if not self.api_key:
             raise FIBOError(
@@ -280,97 +645,203 @@ class FIBOClient:
             "api_token": self.api_key,
             "Content-Type": "application/json"
         }
-
-    @with_retry(max_retries=3, base_delay=1.0, max_delay=10.0)
-    async def generate_structured_image(
+        # Pre-normalized headers and endpoint reused by every hot-path request
+        self._request_headers = httpx.Headers(self.headers)
+        self._text_to_image_endpoint = f"{self.BASE_URL}/v1/text-to-image/base/2.3"
+        self._lifestyle_shot_endpoint = f"{self.BASE_URL}/v1/product/lifestyle_shot_by_text"
+        self._result_cache: TTLCache = TTLCache(
+            maxsize=RESULT_CACHE_SIZE,
+            ttl=RESULT_CACHE_TTL
+        )
+        self._inflight: dict[str, asyncio.Task] = {}
+        # One bulkhead per endpoint family, keyed by endpoint URL; each caps
+        # in-flight generations so bursts don't trigger upstream rate limits
+        max_concurrency = settings.fibo_max_concurrency or 8
+        self._pools: dict[str, EndpointPool] = {
+            endpoint: EndpointPool(
+                max_concurrency,
+                transport_factory() if transport_factory is not None else None
+            )
+            for endpoint in (self._text_to_image_endpoint, self._lifestyle_shot_endpoint)
+        }
+        # Monotonic time until which calls fail fast after a 401; the key
+        # is tried again afterwards in case the rejection was transient
+        self._auth_invalid_until = 0.0
+    
+    async def __aenter__(self) -> "FIBOClient":
+        return self
+    
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+    
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get the HTTP client of the text-to-image pool.
+        
+        Returns:
+            Pooled httpx.AsyncClient instance.
+        """
+        return self._pools[self._text_to_image_endpoint].get_client()
+    
+    async def aclose(self) -> None:
+        """Close every endpoint pool and release pooled connections."""
+        for pool in self._pools.values():
+            await pool.aclose()
+    
+    async def warm_up(self) -> None:
+        """Open pooled connections to the FIBO API ahead of the first generation.
+        
+        Sends a best-effort HEAD request to the API host from every endpoint
+        pool, so the TCP and TLS handshakes overlap with other work such as
+        storyboard generation. Failures are only logged; the real request
+        reports any problem.
+        """
+        async def _open(pool: EndpointPool) -> None:
+            try:
+                await pool.get_client().head(self.BASE_URL, timeout=STATUS_TIMEOUT)
+            except httpx.HTTPError as e:
+                logger.debug("FIBO warm-up failed: %s", e)
+        
+        await asyncio.gather(*(_open(pool) for pool in self._pools.values()))
+    
+    def reset_auth(self, api_key: Optional[str] = None) -> None:
+        """Clear a cached invalid-key failure, optionally switching API key.
+        
+        Args:
+            api_key: New FIBO API key. If not provided, the current key is kept.
+        """
+        if api_key:
+            self.api_key = api_key
+            self.headers = {**self.headers, "api_token": api_key}
+            self._request_headers = httpx.Headers(self.headers)
+        self._auth_invalid_until = 0.0
+    
+    def _check_auth(self) -> None:
+        """Raise immediately if the API key was rejected recently.
+        
+        Raises:
+            FIBOAPIError: If a request returned 401 less than
+                fibo_auth_failure_ttl seconds ago.
+        """
+        if time.monotonic() < self._auth_invalid_until:
+            raise FIBOAPIError("Invalid FIBO API key", status_code=401)
+    
+    async def _post(
         self,
-        structured_prompt: FIBOStructuredPrompt,
-        aspect_ratio: str = "9:16",
-        num_results: int = 1
+        pool: EndpointPool,
+        url: str,
+        **kwargs: Any
+    ) -> httpx.Response:
+        """POST to the FIBO API through the pool's client and circuit breaker.
+        
+        Transient 429/5xx responses are returned as is; _post_and_resolve
+        maps them to retryable errors and with_retry backs off.
+        
+        Args:
+            pool: Endpoint pool whose client and circuit breaker to use.
+            url: Endpoint URL.
+            **kwargs: Forwarded to client.post().
+            
+        Returns:
+            The API response.
+            
+        Raises:
+            FIBOCircuitOpenError: If the circuit breaker is open.
+        """
+        return await pool.breaker.call(pool.get_client().post, url, **kwargs)
+    
+    @with_retry(
+        max_retries=settings.fibo_max_retries,
+        base_delay=settings.fibo_base_delay,
+        max_delay=settings.fibo_max_delay
+    )
+    async def _post_and_resolve(
+        self,
+        endpoint: str,
+        payload: Union[dict, bytes]
     ) -> FIBOGenerationResult:
-        """Generate an image using FIBO structured-prompt-generate API.
+        """Send a generation request and resolve it to an image URL.
         
-        Uses structured JSON prompts for deterministic control over
-        camera, lighting, composition, and style.
+        Shared by all generate_* methods: posts the payload, maps error
+        statuses to FIBO errors, and returns the sync result or polls the
+        status URL when the API answers asynchronously. Each endpoint family
+        runs in its own pool, with at most fibo_max_concurrency requests in
+        flight; the rest wait their turn.
         
         Args:
-            structured_prompt: FIBOStructuredPrompt with scene parameters.
-            aspect_ratio: Aspect ratio for the image (9:16, 1:1, 16:9).
-            num_results: Number of images to generate (default 1).
+            endpoint: FIBO API endpoint URL; must have a pool in self._pools.
+            payload: Request body, either a dict or pre-encoded JSON bytes.
             
         Returns:
             FIBOGenerationResult with request_id and image_url.
             
         Raises:
             FIBOAPIError: If the API returns an error response.
-            FIBOTimeoutError: If polling exceeds MAX_POLL_TIME.
+            FIBOTimeoutError: If the request or polling times out.
             FIBOError: For other errors.
         """
-        endpoint = f"{self.BASE_URL}/v1/text-to-image/base/2.3"
+        pool = self._pools[endpoint]
+        # Fail fast during an outage, before queueing or serializing anything
+        if pool.breaker.is_open():
+            raise FIBOCircuitOpenError()
         
-        # Build the prompt string from structured data for text-to-image endpoint
-        # The structured prompt provides deterministic control via detailed description
-        prompt_parts = [
-            structured_prompt.scene_description,
-            f"Camera: {structured_prompt.camera.get('angle', 'medium_shot')} shot",
-            f"Lighting: {structured_prompt.lighting.get('style', 'natural')} lighting",
-            f"Composition: subject {structured_prompt.composition.get('subject_position', 'center')}",
-        ]
-        
-        if structured_prompt.style.get("mood"):
-            prompt_parts.append(f"Mood: {structured_prompt.style['mood']}")
-        
-        if structured_prompt.style.get("color_palette"):
-            colors = ", ".join(structured_prompt.style["color_palette"])
-            prompt_parts.append(f"Color palette: {colors}")
-        
-        enhanced_prompt = ". ".join(prompt_parts)
-        
-        payload = {
-            "prompt": enhanced_prompt,
-            "num_results": num_results,
-            "aspect_ratio": aspect_ratio,
-            "sync": True
-        }
-        
-        async with httpx.AsyncClient(timeout=120.0) as client:
+        async with pool.sem:
+            self._check_auth()
+            
+            body = payload if isinstance(payload, bytes) else orjson.dumps(payload)
+            
+            started = time.monotonic()
+            status: Optional[int] = None
             try:
-                response = await client.post(
+                response = await self._post(
+                    pool,
                     endpoint,
-                    headers=self.headers,
-                    json=payload
+                    headers=self._request_headers,
+                    content=body
                 )
+                status = response.status_code
                 
                 if response.status_code == 401:
+                    self._auth_invalid_until = (
+                        time.monotonic() + settings.fibo_auth_failure_ttl
+                    )
                     raise FIBOAPIError(
                         "Invalid FIBO API key",
                         status_code=401
                     )
                 
+                if response.status_code in RATE_LIMIT_STATUS_CODES:
+                    raise FIBORateLimitError(
+                        f"FIBO API rate limited: {response.text}",
+                        status_code=response.status_code,
+                        retry_after=_parse_retry_after(response.headers.get("Retry-After"))
+                    )
+                
                 if response.status_code != 200 and response.status_code != 202:
                     raise FIBOAPIError(
                         f"FIBO API error: {response.text}",
                         status_code=response.status_code
                     )
                 
-                data = response.json()
+                data = orjson.loads(response.content)
                 
                 # Handle sync response - result is returned directly
-                result = data.get("result")
-                if result and len(result) > 0:
-                    urls = result[0].get("urls")
-                    if urls and len(urls) > 0:
-                        return FIBOGenerationResult(
-                            request_id=result[0].get("uuid", "sync-request"),
-                            image_url=urls[0]
-                        )
+                sync_result = _extract_sync_result(data)
+                if sync_result is not None:
+                    return FIBOGenerationResult(
+                        request_id=sync_result[0],
+                        image_url=sync_result[1]
+                    )
                 
                 # Fallback to async polling if sync didn't return result directly
                 request_id = data.get("sid")
                 status_url = data.get("status_url")
                 
                 if status_url:
-                    image_url = await self.poll_status(request_id or "unknown", status_url, client)
+                    image_url = await self.poll_status(
+                        request_id or "unknown",
+                        status_url,
+                        pool.get_client()
+                    )
                     return FIBOGenerationResult(
                         request_id=request_id or "unknown",
                         image_url=image_url
@@ -384,8 +855,67 @@ class FIBOClient:
                 raise FIBOTimeoutError("Request to FIBO API timed out")
             except httpx.RequestError as e:
                 raise FIBOError(f"Network error communicating with FIBO API: {str(e)}")
-
-    @with_retry(max_retries=3, base_delay=1.0, max_delay=10.0)
+            finally:
+                # Per-call metrics for tuning timeouts, polling and concurrency
+                latency_ms = (time.monotonic() - started) * 1000
+                logger.info(
+                    "fibo_call endpoint=%s status=%s attempts=%d latency_ms=%.0f",
+                    endpoint, status, _retry_attempt.get(), latency_ms,
+                    extra={
+                        "endpoint": endpoint,
+                        "status": status,
+                        "attempts": _retry_attempt.get(),
+                        "latency_ms": latency_ms,
+                    }
+                )
+    
+    async def generate_structured_image(
+        self,
+        structured_prompt: FIBOStructuredPrompt,
+        aspect_ratio: str = "9:16",
+        num_results: int = 1
+    ) -> FIBOGenerationResult:
+        """Generate an image using FIBO structured-prompt-generate API.
+        
+        Uses structured JSON prompts for deterministic control over
+        camera, lighting, composition, and style.
+        
+        Args:
+            structured_prompt: FIBOStructuredPrompt with scene parameters.
+            aspect_ratio: Aspect ratio for the image (9:16, 1:1, 16:9).
+            num_results: Number of images to generate (default 1).
+            
+        Returns:
+            FIBOGenerationResult with request_id and image_url.
+            
+        Raises:
+            FIBOAPIError: If the API returns an error response.
+            FIBOTimeoutError: If polling exceeds MAX_POLL_TIME.
+            FIBOError: For other errors.
+        """
+        # Build the prompt string from structured data for text-to-image endpoint
+        # The structured prompt provides deterministic control via detailed description
+        prompt_parts = [
+            structured_prompt.scene_description,
+            f"Camera: {structured_prompt.camera.get('angle', 'medium_shot')} shot",
+            f"Lighting: {structured_prompt.lighting.get('style', 'natural')} lighting",
+            f"Composition: subject {structured_prompt.composition.get('subject_position', 'center')}",
+        ]
+        
+        if structured_prompt.style.get("mood"):
+            prompt_parts.append(f"Mood: {structured_prompt.style['mood']}")
+        
+        if structured_prompt.style.get("color_palette"):
+            colors = ", ".join(structured_prompt.style["color_palette"])
+            prompt_parts.append(f"Color palette: {colors}")
+        
+        enhanced_prompt = ". ".join(prompt_parts)
+        
+        return await self._post_and_resolve(
+            self._text_to_image_endpoint,
+            _text_to_image_body(enhanced_prompt, num_results, aspect_ratio)
+        )
+    
     async def generate_with_structured_prompt(
         self,
         structured_prompt: "FIBOStructuredPromptV2",
@@ -410,64 +940,10 @@ class FIBOClient:
             
         Requirements: 5.1
         """
-        endpoint = f"{self.BASE_URL}/v1/text-to-image/base/2.3"
-        
-        # Use the structured prompt's to_api_payload method for proper formatting
-        payload = structured_prompt.to_api_payload(aspect_ratio)
-        
-        async with httpx.AsyncClient(timeout=120.0) as client:
-            try:
-                response = await client.post(
-                    endpoint,
-                    headers=self.headers,
-                    json=payload
-                )
-                
-                if response.status_code == 401:
-                    raise FIBOAPIError(
-                        "Invalid FIBO API key",
-                        status_code=401
-                    )
-                
-                if response.status_code != 200 and response.status_code != 202:
-                    raise FIBOAPIError(
-                        f"FIBO API error: {response.text}",
-                        status_code=response.status_code
-                    )
-                
-                data = response.json()
-                
-                # Handle sync response - result is returned directly
-                result = data.get("result")
-                if result and len(result) > 0:
-                    urls = result[0].get("urls")
-                    if urls and len(urls) > 0:
-                        return FIBOGenerationResult(
-                            request_id=result[0].get("uuid", "sync-request"),
-                            image_url=urls[0]
-                        )
-                
-                # Fallback to async polling if sync didn't return result directly
-                request_id = data.get("sid")
-                status_url = data.get("status_url")
-                
-                if status_url:
-                    image_url = await self.poll_status(request_id or "unknown", status_url, client)
-                    return FIBOGenerationResult(
-                        request_id=request_id or "unknown",
-                        image_url=image_url
-                    )
-                
-                raise FIBOAPIError(
-                    f"Invalid response from FIBO API: {data}"
-                )
-                
-            except httpx.TimeoutException:
-                raise FIBOTimeoutError("Request to FIBO API timed out")
-            except httpx.RequestError as e:
-                raise FIBOError(f"Network error communicating with FIBO API: {str(e)}")
-
-    @with_retry(max_retries=3, base_delay=1.0, max_delay=10.0)
+        # Send the structured prompt's pre-encoded body as-is
+        body = structured_prompt.to_api_bytes(aspect_ratio)
+        return await self._post_and_resolve(self._text_to_image_endpoint, body)
+    
     async def generate_image(
         self,
         prompt: str,
@@ -476,7 +952,10 @@ class FIBOClient:
     ) -> FIBOGenerationResult:
         """Generate an image using FIBO text-to-image API.
         
-        Sends a request to the FIBO API and polls for the result.
+        Sends a request to the FIBO API and polls for the result. Results are
+        cached for RESULT_CACHE_TTL seconds, so identical requests made within
+        that window return the cached image without calling the API, and
+        identical requests made while one is in flight await the same call.
         
         Args:
             prompt: Text description of the image to generate.
@@ -491,68 +970,38 @@ class FIBOClient:
             FIBOTimeoutError: If polling exceeds MAX_POLL_TIME.
             FIBOError: For other errors.
         """
-        endpoint = f"{self.BASE_URL}/v1/text-to-image/base/2.3"
+        self._check_auth()
+        key = _result_cache_key(prompt, aspect_ratio, num_results)
+        cached = self._result_cache.get(key)
+        if cached is not None:
+            return cached
         
-        payload = {
-            "prompt": prompt,
-            "num_results": num_results,
-            "aspect_ratio": aspect_ratio,
-            "sync": True  # Use sync mode for simpler response handling
-        }
+        # Concurrent identical requests share a single API call
+        task = self._inflight.get(key)
+        if task is None:
+            # Only the prompt varies per call; the rest of the body is pre-encoded
+            body = _text_to_image_body(prompt, num_results, aspect_ratio)
+            task = asyncio.create_task(
+                self._post_and_resolve(self._text_to_image_endpoint, body)
+            )
+            self._inflight[key] = task
+            task.add_done_callback(partial(self._forget_inflight, key))
         
-        async with httpx.AsyncClient(timeout=120.0) as client:
-            try:
-                response = await client.post(
-                    endpoint,
-                    headers=self.headers,
-                    json=payload
-                )
-                
-                if response.status_code == 401:
-                    raise FIBOAPIError(
-                        "Invalid FIBO API key",
-                        status_code=401
-                    )
-                
-                if response.status_code != 200 and response.status_code != 202:
-                    raise FIBOAPIError(
-                        f"FIBO API error: {response.text}",
-                        status_code=response.status_code
-                    )
-                
-                data = response.json()
-                
-                # Handle sync response - result is returned directly
-                result = data.get("result")
-                if result and len(result) > 0:
-                    # API returns 'urls' array, not 'url'
-                    urls = result[0].get("urls")
-                    if urls and len(urls) > 0:
-                        return FIBOGenerationResult(
-                            request_id=result[0].get("uuid", "sync-request"),
-                            image_url=urls[0]
-                        )
-                
-                # Fallback to async polling if sync didn't return result directly
-                request_id = data.get("sid")
-                status_url = data.get("status_url")
-                
-                if status_url:
-                    image_url = await self.poll_status(request_id or "unknown", status_url, client)
-                    return FIBOGenerationResult(
-                        request_id=request_id or "unknown",
-                        image_url=image_url
-                    )
-                
-                raise FIBOAPIError(
-                    f"Invalid response from FIBO API: {data}"
-                )
-                
-            except httpx.TimeoutException:
-                raise FIBOTimeoutError("Request to FIBO API timed out")
-            except httpx.RequestError as e:
-                raise FIBOError(f"Network error communicating with FIBO API: {str(e)}")
-
+        # Shield so one cancelled caller doesn't cancel the call for the others
+        result = await asyncio.shield(task)
+        self._result_cache[key] = result
+        return result
+    
+    def _forget_inflight(self, key: str, task: asyncio.Task) -> None:
+        """Remove a finished request from the in-flight map.
+        
+        Also marks the task's exception as retrieved, so a failure whose
+        callers were all cancelled doesn't log an unhandled-exception warning.
+        """
+        self._inflight.pop(key, None)
+        if not task.cancelled():
+            task.exception()
+    
     async def generate_from_scene(
         self,
         fibo_prompt: "FIBOPrompt",
@@ -572,9 +1021,6 @@ class FIBOClient:
         Returns:
             FIBOGenerationResult with request_id and image_url.
         """
-        # Import here to avoid circular imports
-        from app.models import FIBOPrompt as FIBOPromptModel
-        
         structured_prompt = FIBOStructuredPrompt.from_scene_prompt(
             prompt=fibo_prompt.prompt,
             camera_angle=fibo_prompt.camera_angle,
@@ -590,7 +1036,6 @@ class FIBOClient:
             num_results=num_results
         )
 
-    @with_retry(max_retries=3, base_delay=1.0, max_delay=10.0)
     async def generate_with_reference(
         self,
         image_url: str,
@@ -620,74 +1065,14 @@ class FIBOClient:
             
         Requirements: 1.2, 3.1
         """
-        endpoint = f"{self.BASE_URL}/v1/product/lifestyle_shot_by_text"
-        
-        payload = {
-            "image_url": image_url,
-            "num_results": num_results,
-            "sync": True
-        }
+        payload = {**LIFESTYLE_SHOT_TEMPLATE, "image_url": image_url, "num_results": num_results}
         
         # Add prompt if provided for scene guidance
         if prompt:
             payload["scene_description"] = prompt
         
-        async with httpx.AsyncClient(timeout=120.0) as client:
-            try:
-                response = await client.post(
-                    endpoint,
-                    headers=self.headers,
-                    json=payload
-                )
-                
-                if response.status_code == 401:
-                    raise FIBOAPIError(
-                        "Invalid FIBO API key",
-                        status_code=401
-                    )
-                
-                if response.status_code != 200 and response.status_code != 202:
-                    raise FIBOAPIError(
-                        f"FIBO translation API error: {response.text}",
-                        status_code=response.status_code
-                    )
-                
-                data = response.json()
-                
-                # Handle sync response - result is returned directly
-                result = data.get("result")
-                if result and len(result) > 0:
-                    urls = result[0].get("urls")
-                    if urls and len(urls) > 0:
-                        return FIBOGenerationResult(
-                            request_id=result[0].get("uuid", "sync-request"),
-                            image_url=urls[0]
-                        )
-                
-                # Fallback to async polling if sync didn't return result directly
-                request_id = data.get("sid")
-                status_url = data.get("status_url")
-                
-                if status_url:
-                    image_url_result = await self.poll_status(
-                        request_id or "unknown",
-                        status_url,
-                        client
-                    )
-                    return FIBOGenerationResult(
-                        request_id=request_id or "unknown",
-                        image_url=image_url_result
-                    )
-                
-                raise FIBOAPIError(
-                    f"Invalid response from FIBO translation API: {data}"
-                )
-                
-            except httpx.TimeoutException:
-                raise FIBOTimeoutError("Request to FIBO translation API timed out")
-            except httpx.RequestError as e:
-                raise FIBOError(f"Network error communicating with FIBO translation API: {str(e)}")
-
+        return await self._post_and_resolve(self._lifestyle_shot_endpoint, payload)
+    
     async def poll_status(
         self,
         request_id: str,
@@ -696,13 +1081,18 @@ class FIBOClient:
     ) -> str:
         """Poll FIBO status endpoint until completion.
         
-        Polls every POLL_INTERVAL seconds until the request completes
-        or MAX_POLL_TIME is exceeded.
+        Checks the status immediately, then backs off exponentially (with
+        jitter) from POLL_INITIAL_DELAY up to POLL_INTERVAL between checks
+        until the request completes or MAX_POLL_TIME is exceeded. Each check
+        sends a "wait" long-poll hint so a supporting server can hold the
+        request until the job finishes instead of answering "processing";
+        held requests, including ones that hit the read timeout, are
+        re-issued immediately without the backoff sleep.
         
         Args:
             request_id: The request ID from the initial API call.
             status_url: The status URL to poll.
-            client: Optional httpx client to reuse.
+            client: Optional httpx client. Defaults to the text-to-image pool.
             
         Returns:
             The URL of the generated image.
@@ -711,59 +1101,87 @@ class FIBOClient:
             FIBOTimeoutError: If polling exceeds MAX_POLL_TIME.
             FIBOAPIError: If the API returns an error status.
         """
-        should_close_client = client is None
         if client is None:
-            client = httpx.AsyncClient(timeout=30.0)
+            client = self._get_client()
+        
+        loop = asyncio.get_running_loop()
+        delays = _poll_schedule(self.POLL_INITIAL_DELAY, self.POLL_INTERVAL)
+        transient_failures = 0
         
         try:
-            elapsed_time = 0
-            
-            while elapsed_time < self.MAX_POLL_TIME:
-                await asyncio.sleep(self.POLL_INTERVAL)
-                elapsed_time += self.POLL_INTERVAL
-                
-                try:
-                    response = await client.get(
-                        status_url,
-                        headers=self.headers
-                    )
-                    
-                    if response.status_code != 200:
-                        raise FIBOAPIError(
-                            f"Status check failed: {response.text}",
-                            status_code=response.status_code
+            async with asyncio.timeout(self.MAX_POLL_TIME) as poll_timeout:
+                deadline = poll_timeout.when()
+                # Probe before the first sleep so fast jobs return without waiting
+                while True:
+                    # Never ask the server, or the GET itself, to run past our deadline
+                    sent_at = loop.time()
+                    remaining = deadline - sent_at
+                    if remaining <= 0:
+                        raise TimeoutError
+                    wait = min(LONG_POLL_WAIT, max(int(remaining), 0))
+                    try:
+                        response = await client.get(
+                            status_url,
+                            params={"wait": wait},
+                            headers=self._request_headers,
+                            timeout=min(STATUS_TIMEOUT + wait, remaining)
                         )
+                        
+                        if response.status_code in TRANSIENT_STATUS_CODES:
+                            # Rate limited or transient server error, wait and poll again
+                            await asyncio.sleep(
+                                _transient_delay(response, transient_failures)
+                            )
+                            transient_failures += 1
+                            continue
+                        
+                        if response.status_code != 200:
+                            raise FIBOAPIError(
+                                f"Status check failed: {response.text}",
+                                status_code=response.status_code
+                            )
+                        
+                        # Most polls report "processing", so peek at the status
+                        # and only decode the full body once the job looks done
+                        content = response.content
+                        peek = _STATUS_PEEK.search(content, 0, STATUS_PEEK_BYTES)
+                        if peek is not None and peek[1].lower() not in _TERMINAL_STATUSES:
+                            status = "processing"
+                        else:
+                            data = orjson.loads(content)
+                            status = data.get("status", "").lower()
+                        
+                        if status == "completed":
+                            sync_result = _extract_sync_result(data)
+                            if sync_result is not None:
+                                return sync_result[1]
+                            raise FIBOAPIError(
+                                "Completed but no image URL in response"
+                            )
+                        
+                        elif status == "failed":
+                            error_msg = data.get("error", "Unknown error")
+                            raise FIBOAPIError(f"Image generation failed: {error_msg}")
+                        
+                        # Status is still processing, continue polling
+                        
+                    except httpx.ReadTimeout:
+                        # Long poll held past our timeout, reconnect right away
+                        continue
+                    except httpx.TimeoutException:
+                        # Couldn't connect or get a pooled connection, back off
+                        await asyncio.sleep(next(delays) + random.uniform(0, POLL_JITTER))
+                        continue
+                    except httpx.RequestError as e:
+                        raise FIBOError(f"Network error during status check: {str(e)}")
                     
-                    data = response.json()
-                    status = data.get("status", "").lower()
-                    
-                    if status == "completed":
-                        result = data.get("result", [])
-                        if result and len(result) > 0:
-                            # API returns 'urls' array, not 'url'
-                            urls = result[0].get("urls")
-                            if urls and len(urls) > 0:
-                                return urls[0]
-                        raise FIBOAPIError(
-                            "Completed but no image URL in response"
-                        )
-                    
-                    elif status == "failed":
-                        error_msg = data.get("error", "Unknown error")
-                        raise FIBOAPIError(f"Image generation failed: {error_msg}")
-                    
-                    # Status is still processing, continue polling
-                    
-                except httpx.TimeoutException:
-                    # Timeout on status check, continue polling
-                    continue
-                except httpx.RequestError as e:
-                    raise FIBOError(f"Network error during status check: {str(e)}")
-            
+                    # A server that honors the wait hint already held the request,
+                    # so only back off when it answered immediately
+                    if loop.time() - sent_at >= LONG_POLL_HELD:
+                        continue
+                    await asyncio.sleep(next(delays) + random.uniform(0, POLL_JITTER))
+        except TimeoutError:
             # Exceeded max poll time
             raise FIBOTimeoutError(
                 f"FIBO request {request_id} did not complete within {self.MAX_POLL_TIME} seconds"
             )
-        finally:
-            if should_close_client:
-                await client.aclose()
@@ -5,11 +5,59 @@ parameter-driven frame generation.
 
 Requirements: 3.1, 3.2, 3.3, 3.4
 """
+from functools import lru_cache
 from typing import Optional
+
+import orjson
 from pydantic import BaseModel, Field
 
 from app.models import SceneParameters
 
+_HYPHEN_TO_UNDER = str.maketrans({"-": "_"})
+
+
+@lru_cache(maxsize=64)
+def _norm(value: str) -> str:
+    """Convert a hyphenated enum value to the underscored form FIBO expects.
+    
+    Inputs come from small Literal sets, so results are memoized.
+    
+    Args:
+        value: Hyphenated parameter value (e.g. "golden-hour").
+        
+    Returns:
+        Underscored value (e.g. "golden_hour").
+    """
+    return value.translate(_HYPHEN_TO_UNDER)
+
+
+class FIBOCamera(BaseModel):
+    """Camera section of a FIBO structured prompt."""
+    angle: str = Field(default="medium_shot", description="Camera angle (underscored)")
+    shot_type: str = Field(default="", description="Type of shot")
+
+
+class FIBOLighting(BaseModel):
+    """Lighting section of a FIBO structured prompt."""
+    type: str = Field(default="natural", description="Lighting style (underscored)")
+    direction: str = Field(default="", description="Light direction")
+    intensity: str = Field(default="medium", description="Light intensity")
+
+
+class FIBOComposition(BaseModel):
+    """Composition section of a FIBO structured prompt."""
+    subject_position: str = Field(default="center", description="Subject position (underscored)")
+    background: str = Field(default="", description="Background type")
+    depth_of_field: str = Field(default="", description="Depth of field")
+
+
+class FIBOStyle(BaseModel):
+    """Style section of a FIBO structured prompt."""
+    color_palette: list[str] = Field(default_factory=list, description="Hex color codes")
+    material: Optional[str] = Field(default=None, description="Material type")
+    mood: str = Field(default="", description="Overall mood")
+    aesthetic: str = Field(default="", description="Visual aesthetic")
+
 
 class FIBOStructuredPromptV2(BaseModel):
     """Enhanced structured prompt for FIBO API.
@@ -26,10 +74,10 @@ class FIBOStructuredPromptV2(BaseModel):
     """
     
     scene_description: str = Field(..., description="Detailed scene description")
-    camera: dict = Field(..., description="Camera parameters for FIBO")
-    lighting: dict = Field(..., description="Lighting parameters for FIBO")
-    composition: dict = Field(..., description="Composition parameters for FIBO")
-    style: dict = Field(..., description="Style parameters for FIBO")
+    camera: FIBOCamera = Field(..., description="Camera parameters for FIBO")
+    lighting: FIBOLighting = Field(..., description="Lighting parameters for FIBO")
+    composition: FIBOComposition = Field(..., description="Composition parameters for FIBO")
+    style: FIBOStyle = Field(..., description="Style parameters for FIBO")
     
     @classmethod
     def from_scene_parameters(cls, params: SceneParameters) -> "FIBOStructuredPromptV2":
@@ -37,7 +85,8 @@ class FIBOStructuredPromptV2(BaseModel):
         
         Maps all SceneParameters fields to FIBO API JSON structure,
         converting hyphenated values to underscored format as required
-        by the FIBO API.
+        by the FIBO API. SceneParameters is already validated, so the
+        result is built with model_construct to skip re-validation.
         
         Args:
             params: SceneParameters object with camera, lighting, composition,
@@ -48,28 +97,28 @@ class FIBOStructuredPromptV2(BaseModel):
             
         Requirements: 3.1, 3.2
         """
-        return cls(
+        return cls.model_construct(
             scene_description=params.scene_description,
-            camera={
-                "angle": params.camera.angle.replace("-", "_"),
-                "shot_type": params.camera.shot_type
-            },
-            lighting={
-                "type": params.lighting.style.replace("-", "_"),
-                "direction": params.lighting.direction,
-                "intensity": params.lighting.intensity
-            },
-            composition={
-                "subject_position": params.composition.subject_position.replace("-", "_"),
-                "background": params.composition.background,
-                "depth_of_field": params.composition.depth_of_field
-            },
-            style={
-                "color_palette": params.style.color_palette,
-                "material": params.style.material,
-                "mood": params.style.mood,
-                "aesthetic": params.style.aesthetic
-            }
+            camera=FIBOCamera.model_construct(
+                angle=_norm(params.camera.angle),
+                shot_type=params.camera.shot_type
+            ),
+            lighting=FIBOLighting.model_construct(
+                type=_norm(params.lighting.style),
+                direction=params.lighting.direction,
+                intensity=params.lighting.intensity
+            ),
+            composition=FIBOComposition.model_construct(
+                subject_position=_norm(params.composition.subject_position),
+                background=params.composition.background,
+                depth_of_field=params.composition.depth_of_field
+            ),
+            style=FIBOStyle.model_construct(
+                color_palette=params.style.color_palette,
+                material=params.style.material,
+                mood=params.style.mood,
+                aesthetic=params.style.aesthetic
+            )
         )
     
     def to_api_payload(self, aspect_ratio: str = "9:16") -> dict:
@@ -90,32 +139,32 @@ class FIBOStructuredPromptV2(BaseModel):
         prompt_parts = [self.scene_description]
         
         # Add camera details
-        camera_angle = self.camera.get("angle", "medium_shot").replace("_", " ")
-        shot_type = self.camera.get("shot_type", "")
+        camera_angle = self.camera.angle.replace("_", " ")
+        shot_type = self.camera.shot_type
         prompt_parts.append(f"Camera: {camera_angle} {shot_type}".strip())
         
         # Add lighting details
-        lighting_type = self.lighting.get("type", "natural").replace("_", " ")
-        lighting_direction = self.lighting.get("direction", "")
-        lighting_intensity = self.lighting.get("intensity", "medium")
+        lighting_type = self.lighting.type.replace("_", " ")
+        lighting_direction = self.lighting.direction
+        lighting_intensity = self.lighting.intensity
         prompt_parts.append(f"Lighting: {lighting_type}, {lighting_direction}, {lighting_intensity} intensity")
         
         # Add composition details
-        subject_pos = self.composition.get("subject_position", "center").replace("_", " ")
-        background = self.composition.get("background", "")
-        dof = self.composition.get("depth_of_field", "")
+        subject_pos = self.composition.subject_position.replace("_", " ")
+        background = self.composition.background
+        dof = self.composition.depth_of_field
         prompt_parts.append(f"Composition: subject {subject_pos}, {background} background, {dof} depth of field")
         
         # Add style details
-        mood = self.style.get("mood", "")
-        aesthetic = self.style.get("aesthetic", "")
-        material = self.style.get("material", "")
+        mood = self.style.mood
+        aesthetic = self.style.aesthetic
+        material = self.style.material
         if mood or aesthetic or material:
             style_parts = [s for s in [mood, aesthetic, material] if s]
             prompt_parts.append(f"Style: {', '.join(style_parts)}")
         
         # Add color palette if present
-        color_palette = self.style.get("color_palette", [])
+        color_palette = self.style.color_palette
         if color_palette:
             prompt_parts.append(f"Color palette: {', '.join(color_palette)}")
         
@@ -128,6 +177,17 @@ class FIBOStructuredPromptV2(BaseModel):
             "sync": True
         }
     
+    def to_api_bytes(self, aspect_ratio: str = "9:16") -> bytes:
+        """Convert to a JSON-encoded FIBO API request body.
+        
+        Args:
+            aspect_ratio: Video aspect ratio (9:16, 1:1, 16:9). Defaults to 9:16.
+            
+        Returns:
+            to_api_payload() encoded with orjson, ready to send as the body.
+        """
+        return orjson.dumps(self.to_api_payload(aspect_ratio))
+    
     @classmethod
     def from_api_payload(cls, payload: dict) -> "FIBOStructuredPromptV2":
         """Parse a FIBO API payload back to FIBOStructuredPromptV2.
@@ -141,14 +201,12 @@ class FIBOStructuredPromptV2(BaseModel):
         Returns:
             FIBOStructuredPromptV2 instance.
             
+        Raises:
+            ValidationError: If the payload is missing fields or malformed.
+            
         Requirements: 3.4
         """
         structured_prompt = payload.get("structured_prompt", payload)
         
-        return cls(
-            scene_description=structured_prompt["scene_description"],
-            camera=structured_prompt["camera"],
-            lighting=structured_prompt["lighting"],
-            composition=structured_prompt["composition"],
-            style=structured_prompt["style"]
-        )
+        # Hand the mapping straight to the model's compiled validator
+        return cls.model_validate(structured_prompt)
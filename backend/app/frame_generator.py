@@ -9,34 +9,69 @@ Requirements:
 - 4.4: Frames SHALL be stored in sequential order for compositing
 """
 import asyncio
+import logging
+import random
 import uuid
+from contextlib import nullcontext
+from dataclasses import dataclass, field
 from pathlib import Path
+from types import MappingProxyType
 from typing import Optional
 
+import aiofiles
+import aiofiles.os
 import httpx
 from pydantic import BaseModel, Field
 
-from app.fibo_client import FIBOClient, FIBOError
+from app.config import get_settings
+from app.fibo_client import FIBOClient, FIBOError, HTTP2_AVAILABLE
 from app.models import Scene, Storyboard, SceneParameters, EnhancedStoryboard
 from app.fibo_translator import FIBOStructuredPromptV2
 
+logger = logging.getLogger(__name__)
+settings = get_settings()
 
-class GeneratedFrame(BaseModel):
+DOWNLOAD_TIMEOUT = 60.0
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+DOWNLOAD_RETRIES = 3
+DOWNLOAD_RETRY_DELAY = 1.0  # seconds, doubled per retry
+DOWNLOAD_MAX_RETRY_DELAY = 10.0
+# CDN responses worth retrying; other errors won't succeed on a retry
+DOWNLOAD_RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+DOWNLOAD_CONCURRENCY = 32  # concurrent frame downloads per storyboard
+
+# Key frame file name, formatted with the scene number
+FRAME_FILENAME = "scene_%02d_frame_00.png"
+
+# Pixel dimensions (width, height) per supported aspect ratio
+ASPECT_RATIO_DIMENSIONS = MappingProxyType({
+    "9:16": (1080, 1920),  # Vertical/Stories
+    "1:1": (1080, 1080),   # Square
+    "16:9": (1920, 1080),  # Horizontal
+})
+
+
+@dataclass(slots=True)
+class GeneratedFrame:
     """Represents a single generated frame.
     
+    Internal to the pipeline (never returned by the API), so it is a plain
+    slotted dataclass rather than a validated model.
+    
     Attributes:
-        scene_number: The scene this frame belongs to.
+        scene_number: The scene this frame belongs to (1-indexed).
         frame_index: Index of this frame within the scene.
         image_url: Remote URL of the generated image.
         local_path: Local file path where the frame is stored.
     """
-    scene_number: int = Field(..., ge=1, description="Scene number (1-indexed)")
-    frame_index: int = Field(..., ge=0, description="Frame index within scene")
-    image_url: str = Field(..., description="Remote URL of generated image")
-    local_path: str = Field(..., description="Local file path for the frame")
+    scene_number: int
+    frame_index: int
+    image_url: str
+    local_path: str
 
 
-class FrameGenerationResult(BaseModel):
+@dataclass(slots=True)
+class FrameGenerationResult:
     """Result of frame generation for a scene or storyboard.
     
     Attributes:
@@ -44,9 +79,9 @@ class FrameGenerationResult(BaseModel):
         frames: List of generated frames.
         errors: List of error messages for any failures.
     """
-    success: bool = Field(..., description="Whether generation succeeded")
-    frames: list[GeneratedFrame] = Field(default_factory=list, description="Generated frames")
-    errors: list[str] = Field(default_factory=list, description="Error messages")
+    success: bool
+    frames: list[GeneratedFrame] = field(default_factory=list)
+    errors: list[str] = field(default_factory=list)
 
 
 def calculate_frame_count(duration: float, fps: int = 24) -> int:
@@ -77,35 +112,114 @@ def get_dimensions_for_aspect_ratio(aspect_ratio: str) -> tuple[int, int]:
     Returns:
         Tuple of (width, height) in pixels.
     """
-    ratios = {
-        "9:16": (1080, 1920),  # Vertical/Stories
-        "1:1": (1080, 1080),   # Square
-        "16:9": (1920, 1080),  # Horizontal
-    }
-    return ratios.get(aspect_ratio, (1080, 1920))
+    return ASPECT_RATIO_DIMENSIONS.get(aspect_ratio, (1080, 1920))
+
+
+def create_download_client() -> httpx.AsyncClient:
+    """Create a pooled HTTP client for frame downloads.
+    
+    Reusing one client across a storyboard keeps connections to the image
+    CDN alive, so each frame after the first skips the TCP and TLS handshake.
+    
+    Returns:
+        httpx.AsyncClient with keep-alive pooling (HTTP/2 when available).
+    """
+    return httpx.AsyncClient(
+        timeout=DOWNLOAD_TIMEOUT,
+        http2=HTTP2_AVAILABLE,
+        limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+    )
+
+
+def _is_retryable_download_error(error: httpx.HTTPError) -> bool:
+    """Whether a failed frame download may succeed if tried again."""
+    if isinstance(error, httpx.HTTPStatusError):
+        return error.response.status_code in DOWNLOAD_RETRY_STATUS_CODES
+    return isinstance(error, httpx.TransportError)
 
 
-async def download_image(image_url: str, local_path: Path) -> bool:
+async def _stream_image(client: httpx.AsyncClient, image_url: str, local_path: Path) -> None:
+    """Stream an image to disk.
+    
+    The image is written to a temporary file and renamed into place, so a
+    failed download never leaves a truncated frame (or clobbers the one
+    being regenerated).
+    
+    Args:
+        client: HTTP client to download with.
+        image_url: URL of the image to download.
+        local_path: Local path to save the image. Its directory must exist.
+        
+    Raises:
+        httpx.HTTPStatusError: If the server returns an error response.
+        httpx.TransportError: If the download fails on the network.
+    """
+    # Stream the body to disk in chunks so the full image is never held
+    # in memory and file writes don't block the event loop
+    async with client.stream("GET", image_url) as response:
+        response.raise_for_status()
+        part_path = local_path.with_name(local_path.name + ".part")
+        try:
+            async with aiofiles.open(part_path, "wb") as f:
+                async for chunk in response.aiter_bytes(DOWNLOAD_CHUNK_SIZE):
+                    await f.write(chunk)
+            await aiofiles.os.replace(part_path, local_path)
+        except BaseException:
+            try:
+                await aiofiles.os.remove(part_path)
+            except OSError:
+                pass
+            raise
+
+
+async def download_image(
+    image_url: str,
+    local_path: Path,
+    client: Optional[httpx.AsyncClient] = None
+) -> bool:
     """Download an image from URL to local storage.
     
+    Network errors and 429/5xx responses are retried up to
+    DOWNLOAD_RETRIES times with jittered exponential backoff, so a
+    download blip doesn't cost a whole new FIBO generation. Other error
+    responses fail immediately.
+    The caller creates the frame directory once per job, so it is not
+    re-checked for every frame.
+    
     Args:
         image_url: URL of the image to download.
-        local_path: Local path to save the image.
+        local_path: Local path to save the image. Its directory must exist.
+        client: Optional shared HTTP client. A one-off client is created
+            (and closed) when not provided.
         
     Returns:
         True if download succeeded, False otherwise.
     """
-    try:
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            response = await client.get(image_url)
-            if response.status_code == 200:
-                # Ensure parent directory exists
-                local_path.parent.mkdir(parents=True, exist_ok=True)
-                local_path.write_bytes(response.content)
-                return True
+    if client is None:
+        async with httpx.AsyncClient(timeout=DOWNLOAD_TIMEOUT) as one_off:
+            return await download_image(image_url, local_path, one_off)
+    
+    for attempt in range(DOWNLOAD_RETRIES + 1):  # +1 for initial attempt
+        try:
+            await _stream_image(client, image_url, local_path)
+            return True
+        except httpx.HTTPError as e:
+            if attempt >= DOWNLOAD_RETRIES or not _is_retryable_download_error(e):
+                logger.warning("Failed to download %s: %s", image_url, e)
+                return False
+            # Full jitter so frames that fail together don't retry in lockstep
+            delay = random.uniform(
+                0, min(DOWNLOAD_RETRY_DELAY * (2 ** attempt), DOWNLOAD_MAX_RETRY_DELAY)
+            )
+            logger.warning(
+                "Frame download failed (attempt %d/%d): %s. Retrying in %.1fs...",
+                attempt + 1, DOWNLOAD_RETRIES + 1, e, delay
+            )
+            await asyncio.sleep(delay)
+        except OSError as e:
+            logger.warning("Failed to download %s: %s", image_url, e)
             return False
-    except Exception:
-        return False
+    return False
 
 
 async def generate_frames_for_scene(
@@ -114,7 +228,10 @@ async def generate_frames_for_scene(
     fibo_client: FIBOClient,
     output_dir: Path,
     reference_image_url: Optional[str] = None,
-    use_structured_prompt: bool = True
+    use_structured_prompt: bool = True,
+    client: Optional[httpx.AsyncClient] = None,
+    generation_slot: Optional[asyncio.Semaphore] = None,
+    download_slot: Optional[asyncio.Semaphore] = None
 ) -> FrameGenerationResult:
     """Generate frames for a single scene using FIBO API.
     
@@ -133,6 +250,9 @@ async def generate_frames_for_scene(
             When provided, uses generate_with_reference for visual consistency.
         use_structured_prompt: If True, uses structured prompt format for
             deterministic control over camera, lighting, composition.
+        client: Optional shared HTTP client for the frame download.
+        generation_slot: Optional semaphore held only while FIBO generates.
+        download_slot: Optional semaphore held only while the frame downloads.
         
     Returns:
         FrameGenerationResult with generated frames or errors.
@@ -145,52 +265,54 @@ async def generate_frames_for_scene(
     try:
         fibo_prompt = scene.fibo_prompt
         
-        # Build the scene prompt for guidance
-        full_prompt = (
-            f"{fibo_prompt.prompt}. "
-            f"Camera angle: {fibo_prompt.camera_angle}. "
-            f"Lighting: {fibo_prompt.lighting_style}. "
-            f"Subject position: {fibo_prompt.subject_position}."
-        )
+        # Build the scene prompt for guidance from parts, joined once
+        parts = [
+            fibo_prompt.prompt, ". Camera angle: ", fibo_prompt.camera_angle,
+            ". Lighting: ", fibo_prompt.lighting_style,
+            ". Subject position: ", fibo_prompt.subject_position, ".",
+        ]
         
         if fibo_prompt.mood:
-            full_prompt += f" Mood: {fibo_prompt.mood}."
+            parts += (" Mood: ", fibo_prompt.mood, ".")
         
         if fibo_prompt.color_palette:
-            colors = ", ".join(fibo_prompt.color_palette)
-            full_prompt += f" Color palette: {colors}."
-        
-        if reference_image_url:
-            # Use translation endpoint with reference image (Requirements 1.2, 3.1)
-            # This maintains visual consistency with the user's uploaded product image
-            result = await fibo_client.generate_with_reference(
-                image_url=reference_image_url,
-                prompt=full_prompt,
-                aspect_ratio=aspect_ratio,
-                num_results=1
-            )
-        elif use_structured_prompt:
-            # Use structured prompt for deterministic control (Requirements 3.1, 3.2)
-            # Maps storyboard scene data to FIBO structured prompt format
-            result = await fibo_client.generate_from_scene(
-                fibo_prompt=fibo_prompt,
-                aspect_ratio=aspect_ratio,
-                num_results=1
-            )
-        else:
-            # Fallback to simple text prompt
-            result = await fibo_client.generate_image(
-                prompt=full_prompt,
-                aspect_ratio=aspect_ratio,
-                num_results=1
-            )
+            parts += (" Color palette: ", ", ".join(fibo_prompt.color_palette), ".")
+        
+        full_prompt = "".join(parts)
+        
+        async with generation_slot or nullcontext():
+            if reference_image_url:
+                # Use translation endpoint with reference image (Requirements 1.2, 3.1)
+                # This maintains visual consistency with the user's uploaded product image
+                result = await fibo_client.generate_with_reference(
+                    image_url=reference_image_url,
+                    prompt=full_prompt,
+                    aspect_ratio=aspect_ratio,
+                    num_results=1
+                )
+            elif use_structured_prompt:
+                # Use structured prompt for deterministic control (Requirements 3.1, 3.2)
+                # Maps storyboard scene data to FIBO structured prompt format
+                result = await fibo_client.generate_from_scene(
+                    fibo_prompt=fibo_prompt,
+                    aspect_ratio=aspect_ratio,
+                    num_results=1
+                )
+            else:
+                # Fallback to simple text prompt
+                result = await fibo_client.generate_image(
+                    prompt=full_prompt,
+                    aspect_ratio=aspect_ratio,
+                    num_results=1
+                )
         
         # Create local path for the frame
-        frame_filename = f"scene_{scene.scene_number:02d}_frame_00.png"
+        frame_filename = FRAME_FILENAME % scene.scene_number
         local_path = output_dir / frame_filename
         
-        # Download the generated image
-        download_success = await download_image(result.image_url, local_path)
+        # Download the generated image (the generation slot is already free)
+        async with download_slot or nullcontext():
+            download_success = await download_image(result.image_url, local_path, client)
         
         if download_success:
             frame = GeneratedFrame(
@@ -220,18 +342,23 @@ async def generate_all_frames(
     storyboard: Storyboard,
     fibo_client: FIBOClient,
     output_dir: Optional[Path] = None,
-    reference_image_url: Optional[str] = None
+    reference_image_url: Optional[str] = None,
+    client: Optional[httpx.AsyncClient] = None
 ) -> FrameGenerationResult:
     """Generate frames for all scenes in a storyboard.
     
-    Processes each scene sequentially to generate key frames.
-    Frames are stored in sequential order for compositing.
+    Processes scenes concurrently to generate key frames. FIBO calls are
+    bounded by ``frame_concurrency`` and downloads by DOWNLOAD_CONCURRENCY,
+    so downloads overlap with other scenes' generation. Frames are returned
+    in storyboard scene order for compositing.
     
     Args:
         storyboard: The complete storyboard with all scenes.
         fibo_client: FIBO API client instance.
-        output_dir: Directory to store frames. If None, creates a temp directory.
+        output_dir: Existing directory to store frames. If None, creates a
+            temp directory.
         reference_image_url: Optional reference image for all scenes.
+        client: Optional shared HTTP client for frame downloads.
         
     Returns:
         FrameGenerationResult with all generated frames or errors.
@@ -240,30 +367,45 @@ async def generate_all_frames(
     """
     # Create output directory if not provided
     if output_dir is None:
-        job_id = str(uuid.uuid4())
+        job_id = uuid.uuid4().hex
         output_dir = Path("/tmp/fabflow") / job_id / "frames"
-    
-    output_dir.mkdir(parents=True, exist_ok=True)
+        output_dir.mkdir(parents=True, exist_ok=True)
     
     all_frames: list[GeneratedFrame] = []
     all_errors: list[str] = []
     
-    # Process scenes sequentially to maintain order (Requirement 4.4)
-    for scene in storyboard.scenes:
-        result = await generate_frames_for_scene(
-            scene=scene,
-            aspect_ratio=storyboard.aspect_ratio,
-            fibo_client=fibo_client,
-            output_dir=output_dir,
-            reference_image_url=reference_image_url
-        )
-        
+    # Scenes are independent, so generate them concurrently. Generation and
+    # download are limited separately so a scene that is downloading frees
+    # its generation slot for the next scene's FIBO call.
+    generation_slot = asyncio.Semaphore(settings.frame_concurrency)
+    download_slot = asyncio.Semaphore(DOWNLOAD_CONCURRENCY)
+    
+    results = await asyncio.gather(
+        *(
+            generate_frames_for_scene(
+                scene=scene,
+                aspect_ratio=storyboard.aspect_ratio,
+                fibo_client=fibo_client,
+                output_dir=output_dir,
+                reference_image_url=reference_image_url,
+                client=client,
+                generation_slot=generation_slot,
+                download_slot=download_slot
+            )
+            for scene in storyboard.scenes
+        ),
+        return_exceptions=True
+    )
+    
+    # gather returns results in storyboard order, which is the order the
+    # compositor pairs frames with scenes, so no re-sort is needed (Requirement 4.4)
+    for scene, result in zip(storyboard.scenes, results):
+        if isinstance(result, BaseException):
+            all_errors.append(f"Scene {scene.scene_number}: Unexpected error - {str(result)}")
+            continue
         all_frames.extend(result.frames)
         all_errors.extend(result.errors)
     
-    # Sort frames by scene number and frame index to ensure sequential order
-    all_frames.sort(key=lambda f: (f.scene_number, f.frame_index))
-    
     return FrameGenerationResult(
         success=len(all_errors) == 0,
         frames=all_frames,
@@ -295,6 +437,23 @@ class FrameGeneratorService:
         """
         self.fibo_client = fibo_client or FIBOClient()
         self.base_output_dir = base_output_dir or Path("/tmp/fabflow")
+        self._http_client: Optional[httpx.AsyncClient] = None
+    
+    def _get_http_client(self) -> httpx.AsyncClient:
+        """Get or create the shared frame download client.
+        
+        Returns:
+            Pooled httpx.AsyncClient instance.
+        """
+        if self._http_client is None or self._http_client.is_closed:
+            self._http_client = create_download_client()
+        return self._http_client
+    
+    async def aclose(self) -> None:
+        """Close the shared frame download client."""
+        if self._http_client is not None:
+            await self._http_client.aclose()
+            self._http_client = None
     
     def create_job_directory(self, job_id: str) -> Path:
         """Create a directory for a specific job's frames.
@@ -328,7 +487,7 @@ class FrameGeneratorService:
         Requirements: 4.1, 4.2, 4.4
         """
         if job_id is None:
-            job_id = str(uuid.uuid4())
+            job_id = uuid.uuid4().hex
         
         output_dir = self.create_job_directory(job_id)
         
@@ -336,7 +495,8 @@ class FrameGeneratorService:
             storyboard=storyboard,
             fibo_client=self.fibo_client,
             output_dir=output_dir,
-            reference_image_url=reference_image_url
+            reference_image_url=reference_image_url,
+            client=self._get_http_client()
         )
     
     def get_frame_count_for_storyboard(self, storyboard: Storyboard, fps: int = 24) -> int:
@@ -351,10 +511,7 @@ class FrameGeneratorService:
         Returns:
             Total number of frames needed at the target FPS.
         """
-        total = 0
-        for scene in storyboard.scenes:
-            total += calculate_frame_count(scene.duration, fps)
-        return total
+        return sum(max(1, int(scene.duration * fps)) for scene in storyboard.scenes)
 
 
 # =============================================================================
@@ -407,6 +564,23 @@ class EnhancedFrameGenerator:
         """
         self.fibo_client = fibo_client or FIBOClient()
         self.base_output_dir = base_output_dir or Path("/tmp/fabflow")
+        self._http_client: Optional[httpx.AsyncClient] = None
+    
+    def _get_http_client(self) -> httpx.AsyncClient:
+        """Get or create the shared frame download client.
+        
+        Returns:
+            Pooled httpx.AsyncClient instance.
+        """
+        if self._http_client is None or self._http_client.is_closed:
+            self._http_client = create_download_client()
+        return self._http_client
+    
+    async def aclose(self) -> None:
+        """Close the shared frame download client."""
+        if self._http_client is not None:
+            await self._http_client.aclose()
+            self._http_client = None
     
     def _hash_parameters(self, scene: SceneParameters) -> str:
         """Generate a hash of scene parameters for change detection.
@@ -442,7 +616,9 @@ class EnhancedFrameGenerator:
         self,
         scene: SceneParameters,
         aspect_ratio: str,
-        output_dir: Path
+        output_dir: Path,
+        generation_slot: Optional[asyncio.Semaphore] = None,
+        download_slot: Optional[asyncio.Semaphore] = None
     ) -> EnhancedGeneratedFrame:
         """Generate a single key frame using FIBO structured prompt.
         
@@ -453,6 +629,8 @@ class EnhancedFrameGenerator:
             scene: SceneParameters with camera, lighting, composition, style.
             aspect_ratio: Target aspect ratio (9:16, 1:1, 16:9).
             output_dir: Directory to store the generated frame.
+            generation_slot: Optional semaphore held only for the FIBO call.
+            download_slot: Optional semaphore held only for the download.
             
         Returns:
             EnhancedGeneratedFrame with image URL, local path, and parameter hash.
@@ -466,17 +644,21 @@ class EnhancedFrameGenerator:
         structured_prompt = FIBOStructuredPromptV2.from_scene_parameters(scene)
         
         # Generate the frame using the structured prompt
-        result = await self.fibo_client.generate_with_structured_prompt(
-            structured_prompt=structured_prompt,
-            aspect_ratio=aspect_ratio
-        )
+        async with generation_slot or nullcontext():
+            result = await self.fibo_client.generate_with_structured_prompt(
+                structured_prompt=structured_prompt,
+                aspect_ratio=aspect_ratio
+            )
         
         # Create local path for the frame
-        frame_filename = f"scene_{scene.scene_number:02d}_frame_00.png"
+        frame_filename = FRAME_FILENAME % scene.scene_number
         local_path = output_dir / frame_filename
         
         # Download the generated image
-        download_success = await download_image(result.image_url, local_path)
+        async with download_slot or nullcontext():
+            download_success = await download_image(
+                result.image_url, local_path, self._get_http_client()
+            )
         
         if not download_success:
             raise FIBOError(
@@ -499,8 +681,11 @@ class EnhancedFrameGenerator:
     ) -> FrameGenerationResult:
         """Generate frames for all scenes in an enhanced storyboard.
         
-        Processes each scene sequentially to generate key frames using
-        structured prompts. Frames are stored in sequential order.
+        Generates key frames for all scenes concurrently using structured
+        prompts, with FIBO calls and downloads bounded as in the module-level
+        generate_all_frames(). Frames are returned in storyboard scene order.
+        Use start_batch() instead to start scenes before the storyboard is
+        complete.
         
         Args:
             storyboard: EnhancedStoryboard with SceneParameters.
@@ -511,42 +696,22 @@ class EnhancedFrameGenerator:
             
         Requirements: 5.2, 5.4
         """
-        if job_id is None:
-            job_id = str(uuid.uuid4())
-        
-        output_dir = self.create_job_directory(job_id)
-        
-        all_frames: list[GeneratedFrame] = []
-        all_errors: list[str] = []
-        
-        # Process scenes sequentially to maintain order (Requirement 5.4)
-        for scene in storyboard.scenes:
-            try:
-                frame = await self.generate_frame_for_scene(
-                    scene=scene,
-                    aspect_ratio=storyboard.aspect_ratio,
-                    output_dir=output_dir
-                )
-                # Convert EnhancedGeneratedFrame to GeneratedFrame for compatibility
-                all_frames.append(GeneratedFrame(
-                    scene_number=frame.scene_number,
-                    frame_index=0,
-                    image_url=frame.image_url,
-                    local_path=frame.local_path
-                ))
-            except FIBOError as e:
-                all_errors.append(f"Scene {scene.scene_number}: {e.message}")
-            except Exception as e:
-                all_errors.append(f"Scene {scene.scene_number}: Unexpected error - {str(e)}")
-        
-        # Sort frames by scene number to ensure sequential order
-        all_frames.sort(key=lambda f: f.scene_number)
+        batch = self.start_batch(storyboard.aspect_ratio, job_id)
+        return await batch.result(storyboard)
+    
+    def start_batch(self, aspect_ratio: str, job_id: Optional[str] = None) -> "FrameBatch":
+        """Start an empty batch that generates frames scene by scene.
         
-        return FrameGenerationResult(
-            success=len(all_errors) == 0,
-            frames=all_frames,
-            errors=all_errors
-        )
+        Args:
+            aspect_ratio: Target aspect ratio (9:16, 1:1, 16:9).
+            job_id: Optional job ID. Generates one if not provided.
+            
+        Returns:
+            FrameBatch to add scenes to as they become available.
+        """
+        if job_id is None:
+            job_id = uuid.uuid4().hex
+        return FrameBatch(self, aspect_ratio, self.create_job_directory(job_id))
     
     async def regenerate_modified_frames(
         self,
@@ -559,7 +724,8 @@ class EnhancedFrameGenerator:
         
         Preserves existing frames for unchanged scenes and only regenerates
         frames for scenes in the scenes_to_regenerate list. If existing frames
-        are missing for any scene, those will also be generated.
+        are missing for any scene, those will also be generated. Scenes are
+        regenerated concurrently.
         
         Args:
             storyboard: EnhancedStoryboard with updated SceneParameters.
@@ -570,6 +736,9 @@ class EnhancedFrameGenerator:
         Returns:
             Dictionary mapping scene numbers to frames (mix of existing and new).
             
+        Raises:
+            FIBOError: If a scene without an existing frame fails to generate.
+            
         Requirements: 5.2, 5.4
         """
         output_dir = self.create_job_directory(job_id)
@@ -586,27 +755,144 @@ class EnhancedFrameGenerator:
             if scene_num not in frames:
                 scenes_needing_generation.add(scene_num)
         
-        # Generate/regenerate the needed scenes
-        for scene_num in scenes_needing_generation:
-            # Find the scene with this number
-            scene = next(
-                (s for s in storyboard.scenes if s.scene_number == scene_num),
-                None
-            )
-            
-            if scene is None:
-                continue
-            
-            try:
-                new_frame = await self.generate_frame_for_scene(
+        # Generate/regenerate the needed scenes concurrently
+        scenes = [
+            scene for scene in storyboard.scenes
+            if scene.scene_number in scenes_needing_generation
+        ]
+        generation_slot = asyncio.Semaphore(settings.frame_concurrency)
+        download_slot = asyncio.Semaphore(DOWNLOAD_CONCURRENCY)
+        
+        results = await asyncio.gather(
+            *(
+                self.generate_frame_for_scene(
                     scene=scene,
                     aspect_ratio=storyboard.aspect_ratio,
-                    output_dir=output_dir
+                    output_dir=output_dir,
+                    generation_slot=generation_slot,
+                    download_slot=download_slot
                 )
-                frames[scene_num] = new_frame
-            except FIBOError:
-                # Keep existing frame if regeneration fails and one exists
-                if scene_num not in frames:
-                    raise  # Re-raise if we don't have a fallback
+                for scene in scenes
+            ),
+            return_exceptions=True
+        )
+        
+        for scene, result in zip(scenes, results):
+            if not isinstance(result, BaseException):
+                frames[scene.scene_number] = result
+            elif not isinstance(result, FIBOError) or scene.scene_number not in frames:
+                # Keep existing frame if regeneration fails and one exists;
+                # re-raise if we don't have a fallback
+                raise result
         
         return frames
+
+
+def _consume_result(task: asyncio.Task) -> None:
+    """Retrieve a discarded task's outcome so its error isn't logged as unhandled."""
+    if not task.cancelled():
+        task.exception()
+
+
+class FrameBatch:
+    """Key frames for one enhanced storyboard, started scene by scene.
+    
+    Lets the v2 pipeline start a scene's frame as soon as the streamed
+    storyboard contains it, instead of waiting for the whole storyboard.
+    FIBO calls and downloads share the same bounds as generate_all_frames().
+    """
+    
+    def __init__(self, generator: EnhancedFrameGenerator, aspect_ratio: str, output_dir: Path):
+        """Initialize an empty batch.
+        
+        Args:
+            generator: Frame generator that renders each scene.
+            aspect_ratio: Target aspect ratio (9:16, 1:1, 16:9).
+            output_dir: Existing directory to store the frames.
+        """
+        self._generator = generator
+        self._aspect_ratio = aspect_ratio
+        self._output_dir = output_dir
+        self._generation_slot = asyncio.Semaphore(settings.frame_concurrency)
+        self._download_slot = asyncio.Semaphore(DOWNLOAD_CONCURRENCY)
+        # Started scenes and their frame tasks, by scene number
+        self._tasks: dict[int, tuple[SceneParameters, asyncio.Task]] = {}
+    
+    def add(self, scene: SceneParameters) -> None:
+        """Start generating a scene's frame (no-op if already started)."""
+        if scene.scene_number in self._tasks:
+            return
+        task = asyncio.create_task(self._generator.generate_frame_for_scene(
+            scene=scene,
+            aspect_ratio=self._aspect_ratio,
+            output_dir=self._output_dir,
+            generation_slot=self._generation_slot,
+            download_slot=self._download_slot
+        ))
+        self._tasks[scene.scene_number] = (scene, task)
+    
+    def _discard(self, scene_number: int) -> None:
+        """Cancel and forget a started scene."""
+        _, task = self._tasks.pop(scene_number)
+        task.cancel()
+        task.add_done_callback(_consume_result)
+    
+    def cancel(self) -> None:
+        """Cancel every started scene."""
+        for scene_number in list(self._tasks):
+            self._discard(scene_number)
+    
+    async def result(self, storyboard: EnhancedStoryboard) -> FrameGenerationResult:
+        """Wait for the frames of the final storyboard.
+        
+        Scenes not started yet are started now. Started scenes whose
+        parameters differ from the final storyboard (or that it no longer
+        contains) are cancelled and, where needed, restarted.
+        
+        Args:
+            storyboard: Final EnhancedStoryboard.
+            
+        Returns:
+            FrameGenerationResult with frames in storyboard scene order.
+            
+        Requirements: 5.2, 5.4
+        """
+        if storyboard.aspect_ratio != self._aspect_ratio:
+            self.cancel()
+            self._aspect_ratio = storyboard.aspect_ratio
+        
+        wanted = {scene.scene_number: scene for scene in storyboard.scenes}
+        for scene_number, (scene, _) in list(self._tasks.items()):
+            if wanted.get(scene_number) != scene:
+                self._discard(scene_number)
+        for scene in storyboard.scenes:
+            self.add(scene)
+        
+        results = await asyncio.gather(
+            *(self._tasks[scene.scene_number][1] for scene in storyboard.scenes),
+            return_exceptions=True
+        )
+        
+        all_frames: list[GeneratedFrame] = []
+        all_errors: list[str] = []
+        
+        # gather keeps storyboard order, so frames stay sequential (Requirement 5.4)
+        for scene, result in zip(storyboard.scenes, results):
+            if isinstance(result, FIBOError):
+                all_errors.append(f"Scene {scene.scene_number}: {result.message}")
+            elif isinstance(result, BaseException):
+                all_errors.append(f"Scene {scene.scene_number}: Unexpected error - {str(result)}")
+            else:
+                # Convert EnhancedGeneratedFrame to GeneratedFrame for compatibility
+                all_frames.append(GeneratedFrame(
+                    scene_number=result.scene_number,
+                    frame_index=0,
+                    image_url=result.image_url,
+                    local_path=result.local_path
+                ))
+        
+        return FrameGenerationResult(
+            success=len(all_errors) == 0,
+            frames=all_frames,
+            errors=all_errors
+        )
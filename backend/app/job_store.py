@@ -0,0 +1,217 @@
+"""Job state storage for FabFlow Studio.
+
+Keeps the status, result and intermediate artifacts of video generation
+jobs behind a single async interface, so the pipeline and the polling
+endpoints never touch shared dicts directly and the backing store can be
+swapped (e.g. for Redis) without changing call sites.
+
+Requirements: 5.1, 5.4
+"""
+import asyncio
+import time
+from typing import Literal, Optional
+
+from pydantic import BaseModel, Field
+
+from app.models import Storyboard, EnhancedStoryboard
+from app.frame_generator import EnhancedGeneratedFrame
+
+
+class JobStatus(BaseModel):
+    """Status of a video generation job."""
+    job_id: str
+    stage: Literal["queued", "storyboard", "frame-generation", "compositing", "complete", "error"]
+    progress: int = Field(ge=0, le=100, description="Progress percentage")
+    message: str = ""
+    error: Optional[str] = None
+
+
+class JobResult(BaseModel):
+    """Result of a completed video generation job."""
+    job_id: str
+    success: bool
+    video_url: Optional[str] = None
+    duration: Optional[float] = None
+    error: Optional[str] = None
+
+
+# Stages after which a job's pipeline has stopped writing to the store
+TERMINAL_STAGES = frozenset({"complete", "error"})
+
+
+class JobStore:
+    """In-memory store for video generation job state (prototype).
+    
+    State lives in the API process, so it is only visible to a single
+    Uvicorn worker. All access goes through async methods so a shared
+    backend can replace the dicts without touching callers.
+    
+    Writes take an asyncio.Lock that guards only the dict updates (no I/O
+    happens while it is held); single-key reads don't need it.
+    
+    Finished jobs are kept until expire() drops them, and at most
+    max_finished of them at a time, so memory stays bounded on a
+    long-running server.
+    """
+    
+    def __init__(self, max_finished: Optional[int] = None):
+        """Initialize an empty job store.
+        
+        Args:
+            max_finished: Finished jobs to keep before evicting the oldest.
+                None keeps them until they expire.
+        """
+        self._max_finished = max_finished
+        self._statuses: dict[str, JobStatus] = {}
+        self._results: dict[str, JobResult] = {}
+        self._storyboards: dict[str, Storyboard] = {}
+        # V2 state for enhanced storyboards and frames
+        self._enhanced_storyboards: dict[str, EnhancedStoryboard] = {}
+        # Serialized v2 storyboards, cached until the storyboard changes
+        self._enhanced_storyboard_json: dict[str, str] = {}
+        self._enhanced_frames: dict[str, dict[int, EnhancedGeneratedFrame]] = {}
+        # Monotonic time each job reached a terminal stage, oldest first
+        self._finished_at: dict[str, float] = {}
+        self._lock = asyncio.Lock()
+        # Status change listeners (e.g. open SSE streams), per job
+        self._subscribers: dict[str, set[asyncio.Queue]] = {}
+    
+    def subscribe(self, job_id: str) -> asyncio.Queue:
+        """Register for a job's status changes.
+        
+        Args:
+            job_id: Job to watch.
+            
+        Returns:
+            Queue that receives every JobStatus recorded after this call.
+            Pass it to unsubscribe() when done.
+        """
+        queue: asyncio.Queue = asyncio.Queue()
+        self._subscribers.setdefault(job_id, set()).add(queue)
+        return queue
+    
+    def unsubscribe(self, job_id: str, queue: asyncio.Queue) -> None:
+        """Stop delivering a job's status changes to a queue."""
+        queues = self._subscribers.get(job_id)
+        if queues is not None:
+            queues.discard(queue)
+            if not queues:
+                del self._subscribers[job_id]
+    
+    def _mark_finished(self, job_id: str, status: JobStatus) -> None:
+        """Start (or, if the job is running again, stop) its expiry clock."""
+        # Re-inserting keeps _finished_at ordered by finish time
+        self._finished_at.pop(job_id, None)
+        if status.stage in TERMINAL_STAGES:
+            self._finished_at[job_id] = time.monotonic()
+            if self._max_finished is not None:
+                while len(self._finished_at) > self._max_finished:
+                    self._drop(next(iter(self._finished_at)))
+    
+    def _drop(self, job_id: str) -> None:
+        """Remove all state of a finished job."""
+        del self._finished_at[job_id]
+        self._statuses.pop(job_id, None)
+        self._results.pop(job_id, None)
+        self._storyboards.pop(job_id, None)
+        self._enhanced_storyboards.pop(job_id, None)
+        self._enhanced_storyboard_json.pop(job_id, None)
+        self._enhanced_frames.pop(job_id, None)
+    
+    def _publish(self, job_id: str, status: JobStatus) -> None:
+        """Push a status change to the job's subscribers."""
+        for queue in self._subscribers.get(job_id, ()):
+            queue.put_nowait(status)
+    
+    async def get_status(self, job_id: str) -> Optional[JobStatus]:
+        """Get a job's current status, or None if the job is unknown."""
+        return self._statuses.get(job_id)
+    
+    async def set_status(self, job_id: str, status: JobStatus) -> None:
+        """Record a job's current status."""
+        async with self._lock:
+            self._statuses[job_id] = status
+            self._mark_finished(job_id, status)
+            self._publish(job_id, status)
+    
+    async def get_result(self, job_id: str) -> Optional[JobResult]:
+        """Get a job's final result, or None if it has not finished."""
+        return self._results.get(job_id)
+    
+    async def finish(self, job_id: str, status: JobStatus, result: JobResult) -> None:
+        """Record a job's terminal status and its result together.
+        
+        Both are written under the lock, so a poller never sees a
+        "complete"/"error" status without the matching result.
+        """
+        async with self._lock:
+            self._statuses[job_id] = status
+            self._results[job_id] = result
+            self._mark_finished(job_id, status)
+            self._publish(job_id, status)
+    
+    async def get_storyboard(self, job_id: str) -> Optional[Storyboard]:
+        """Get the storyboard generated for a v1 job."""
+        return self._storyboards.get(job_id)
+    
+    async def set_storyboard(self, job_id: str, storyboard: Storyboard) -> None:
+        """Record the storyboard generated for a v1 job."""
+        async with self._lock:
+            self._storyboards[job_id] = storyboard
+    
+    async def get_enhanced_storyboard(self, job_id: str) -> Optional[EnhancedStoryboard]:
+        """Get the structured storyboard of a v2 job, or None if not a v2 job."""
+        return self._enhanced_storyboards.get(job_id)
+    
+    async def set_enhanced_storyboard(self, job_id: str, storyboard: EnhancedStoryboard) -> None:
+        """Record the structured storyboard of a v2 job."""
+        async with self._lock:
+            self._enhanced_storyboards[job_id] = storyboard
+            self._enhanced_storyboard_json.pop(job_id, None)
+    
+    async def get_enhanced_storyboard_json(self, job_id: str) -> Optional[str]:
+        """Get a v2 job's structured storyboard as JSON, or None if not a v2 job.
+        
+        The JSON is built on first request and reused until the storyboard
+        is replaced.
+        """
+        storyboard_json = self._enhanced_storyboard_json.get(job_id)
+        if storyboard_json is None:
+            storyboard = self._enhanced_storyboards.get(job_id)
+            if storyboard is None:
+                return None
+            storyboard_json = storyboard.model_dump_json()
+            self._enhanced_storyboard_json[job_id] = storyboard_json
+        return storyboard_json
+    
+    async def get_enhanced_frames(self, job_id: str) -> dict[int, EnhancedGeneratedFrame]:
+        """Get a v2 job's frames keyed by scene number (empty if none)."""
+        return self._enhanced_frames.get(job_id, {})
+    
+    async def set_enhanced_frames(
+        self,
+        job_id: str,
+        frames: dict[int, EnhancedGeneratedFrame]
+    ) -> None:
+        """Record a v2 job's frames keyed by scene number."""
+        async with self._lock:
+            self._enhanced_frames[job_id] = frames
+    
+    async def expire(self, max_age: float) -> int:
+        """Drop all state of jobs that finished more than max_age seconds ago.
+        
+        Args:
+            max_age: Seconds a finished job is kept.
+            
+        Returns:
+            Number of jobs removed.
+        """
+        cutoff = time.monotonic() - max_age
+        async with self._lock:
+            expired = [
+                job_id for job_id, finished_at in self._finished_at.items()
+                if finished_at < cutoff
+            ]
+            for job_id in expired:
+                self._drop(job_id)
+        return len(expired)
@@ -1,17 +1,26 @@
 """FabFlow Studio - FastAPI Backend Application."""
+import asyncio
+import re
+import stat
 import uuid
+from contextlib import asynccontextmanager
 from pathlib import Path
-from typing import Literal, Optional
+from typing import Any, Coroutine, Optional
 
-from fastapi import FastAPI, HTTPException, BackgroundTasks
+from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse
-from pydantic import BaseModel, Field
+from fastapi.responses import FileResponse, Response, StreamingResponse
+from pydantic import BaseModel
 
 from app.config import get_settings
 from app.models import UserInput, Storyboard, EnhancedUserInput, EnhancedStoryboard
-from app.storyboard_generator import generate_storyboard, generate_enhanced_storyboard
+from app.storyboard_generator import (
+    generate_storyboard,
+    generate_enhanced_storyboard,
+    close_openai_client,
+)
 from app.fibo_client import FIBOClient
+from app.job_store import JobStore, JobStatus, JobResult, TERMINAL_STAGES
 from app.frame_generator import (
     FrameGeneratorService,
     GeneratedFrame,
@@ -29,33 +38,45 @@ from app.parameter_modification import (
 settings = get_settings()
 
 
-# Job tracking models
-class JobStatus(BaseModel):
-    """Status of a video generation job."""
-    job_id: str
-    stage: Literal["queued", "storyboard", "frame-generation", "compositing", "complete", "error"]
-    progress: int = Field(ge=0, le=100, description="Progress percentage")
-    message: str = ""
-    error: Optional[str] = None
+# In-memory job storage (for prototype). Statuses and results are built
+# from trusted pipeline values, so they use model_construct (no validation).
+job_store = JobStore(max_finished=settings.job_max_finished)
 
+# Generated videos are immutable: regeneration always writes a new job id
+VIDEO_CACHE_CONTROL = "public, max-age=86400, immutable"
 
-class JobResult(BaseModel):
-    """Result of a completed video generation job."""
-    job_id: str
-    success: bool
-    video_url: Optional[str] = None
-    duration: Optional[float] = None
-    error: Optional[str] = None
+# Video filenames are "<job_id>.mp4"; job ids are uuid4 hex (dashed in older jobs)
+VIDEO_FILENAME_RE = re.compile(
+    r"([0-9a-f]{32}|[0-9a-f]{8}(?:-[0-9a-f]{4}){3}-[0-9a-f]{12})\.mp4"
+)
+
+# Seconds between keep-alive comments on an idle job event stream
+JOB_EVENTS_KEEPALIVE = 15.0
 
 
-# In-memory job storage (for prototype)
-jobs: dict[str, JobStatus] = {}
-job_results: dict[str, JobResult] = {}
-job_storyboards: dict[str, Storyboard] = {}
+# Substrings that mark an OpenAI key/authentication failure in an error message
+AUTH_ERROR_MARKERS = ("api_key", "authentication")
 
-# V2 job storage for enhanced storyboards and frames
-job_enhanced_storyboards: dict[str, EnhancedStoryboard] = {}
-job_enhanced_frames: dict[str, dict[int, EnhancedGeneratedFrame]] = {}
+
+def is_auth_error_message(error_message: str) -> bool:
+    """Check whether a storyboard generation error is a credentials problem."""
+    folded = error_message.casefold()
+    return any(marker in folded for marker in AUTH_ERROR_MARKERS)
+
+
+# Response models (declared so FastAPI serializes them with pydantic-core)
+class JobStartedResponse(BaseModel):
+    """Response returned when a background job is started."""
+    job_id: str
+    message: str
+
+
+class ParameterModificationResponse(BaseModel):
+    """Response returned after a parameter modification is applied."""
+    success: bool
+    modified_scenes: list[int]
+    frames_to_regenerate: list[int]
+    message: str
 
 
 # Services (lazy initialization to avoid API key errors at import time)
@@ -99,14 +120,83 @@ def get_enhanced_frame_generator() -> EnhancedFrameGenerator:
         _enhanced_frame_generator = EnhancedFrameGenerator(fibo_client=get_fibo_client())
     return _enhanced_frame_generator
 
+
+# Running background pipelines per job id, kept so they can be cancelled
+# (a v2 job may run a frame regeneration alongside its main pipeline)
+_job_tasks: dict[str, set[asyncio.Task]] = {}
+
+
+def start_job_task(job_id: str, pipeline: Coroutine[Any, Any, None]) -> None:
+    """Run a job's pipeline as a tracked background task.
+    
+    The task is forgotten once it finishes; until then DELETE /api/job/{job_id}
+    and application shutdown can cancel it.
+    
+    Args:
+        job_id: Job the pipeline reports progress for.
+        pipeline: Pipeline coroutine to run.
+    """
+    task = asyncio.create_task(pipeline)
+    _job_tasks.setdefault(job_id, set()).add(task)
+    
+    def forget(done: asyncio.Task) -> None:
+        tasks = _job_tasks.get(job_id)
+        if tasks is not None:
+            tasks.discard(done)
+            if not tasks:
+                del _job_tasks[job_id]
+    
+    task.add_done_callback(forget)
+
+
+async def sweep_expired_jobs() -> None:
+    """Periodically drop finished jobs older than the configured TTL."""
+    while True:
+        await asyncio.sleep(settings.job_sweep_interval)
+        await job_store.expire(settings.job_ttl)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Application lifespan: build shared services once, release them on shutdown.
+    
+    Services are created up front when the FIBO API key is configured, so
+    the first request doesn't pay for client construction. Without a key
+    they stay lazy and report the missing key when first used. The video
+    compositor needs no key and is always built at startup, along with the
+    task that expires finished jobs. On shutdown, running job pipelines are
+    cancelled before the clients are closed.
+    """
+    get_video_compositor_service()
+    if settings.bria_api_key:
+        get_frame_generator_service()
+        get_enhanced_frame_generator()
+    sweeper = asyncio.create_task(sweep_expired_jobs())
+    yield
+    sweeper.cancel()
+    # Stop in-flight pipelines before closing the clients they use
+    tasks = [task for job_tasks in _job_tasks.values() for task in job_tasks]
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+    if _frame_generator_service is not None:
+        await _frame_generator_service.aclose()
+    if _enhanced_frame_generator is not None:
+        await _enhanced_frame_generator.aclose()
+    if _fibo_client is not None:
+        await _fibo_client.aclose()
+    await close_openai_client()
+
+
 app = FastAPI(
     title="FabFlow Studio API",
     description="AI-powered ad video creation platform backend",
     version="0.1.0",
+    lifespan=lifespan,
 )
 
-# Configure CORS for frontend
-origins = [origin.strip() for origin in settings.frontend_url.split(",")]
+# Configure CORS for frontend (a frozenset: CORSMiddleware checks `origin in allow_origins`)
+origins = frozenset(origin.strip() for origin in settings.frontend_url.split(","))
 
 app.add_middleware(
     CORSMiddleware,
@@ -152,7 +242,7 @@ async def generate_storyboard_endpoint(user_input: UserInput) -> Storyboard:
         )
     except Exception as e:
         error_message = str(e)
-        if "api_key" in error_message.lower() or "authentication" in error_message.lower():
+        if is_auth_error_message(error_message):
             raise HTTPException(
                 status_code=500,
                 detail={"code": "API_KEY_ERROR", "message": "OpenAI API key configuration error", "retryable": False}
@@ -179,30 +269,27 @@ async def run_video_generation_pipeline(job_id: str, user_input: UserInput):
     """
     try:
         # Stage 1: Generate storyboard
-        jobs[job_id] = JobStatus(
+        await job_store.set_status(job_id, JobStatus.model_construct(
             job_id=job_id,
             stage="storyboard",
             progress=10,
             message="Generating storyboard..."
-        )
-        
-        storyboard = await generate_storyboard(user_input)
-        job_storyboards[job_id] = storyboard
+        ))
         
-        jobs[job_id] = JobStatus(
-            job_id=job_id,
-            stage="storyboard",
-            progress=25,
-            message="Storyboard generated"
+        # Open FIBO connections while the LLM writes the storyboard
+        storyboard, _ = await asyncio.gather(
+            generate_storyboard(user_input),
+            get_fibo_client().warm_up()
         )
+        await job_store.set_storyboard(job_id, storyboard)
         
         # Stage 2: Generate frames
-        jobs[job_id] = JobStatus(
+        await job_store.set_status(job_id, JobStatus.model_construct(
             job_id=job_id,
             stage="frame-generation",
             progress=30,
             message="Generating frames..."
-        )
+        ))
         
         frame_result = await get_frame_generator_service().generate_frames(
             storyboard=storyboard,
@@ -212,34 +299,30 @@ async def run_video_generation_pipeline(job_id: str, user_input: UserInput):
         
         if not frame_result.success:
             error_msg = "; ".join(frame_result.errors) if frame_result.errors else "Frame generation failed"
-            jobs[job_id] = JobStatus(
-                job_id=job_id,
-                stage="error",
-                progress=0,
-                message="Frame generation failed",
-                error=error_msg
-            )
-            job_results[job_id] = JobResult(
-                job_id=job_id,
-                success=False,
-                error=error_msg
+            await job_store.finish(
+                job_id,
+                JobStatus.model_construct(
+                    job_id=job_id,
+                    stage="error",
+                    progress=0,
+                    message="Frame generation failed",
+                    error=error_msg
+                ),
+                JobResult.model_construct(
+                    job_id=job_id,
+                    success=False,
+                    error=error_msg
+                )
             )
             return
         
-        jobs[job_id] = JobStatus(
-            job_id=job_id,
-            stage="frame-generation",
-            progress=70,
-            message=f"Generated {len(frame_result.frames)} frames"
-        )
-        
         # Stage 3: Composite video
-        jobs[job_id] = JobStatus(
+        await job_store.set_status(job_id, JobStatus.model_construct(
             job_id=job_id,
             stage="compositing",
             progress=75,
             message="Compositing video..."
-        )
+        ))
         
         composite_result = await get_video_compositor_service().composite(
             frames=frame_result.frames,
@@ -248,56 +331,62 @@ async def run_video_generation_pipeline(job_id: str, user_input: UserInput):
         )
         
         if not composite_result.success:
-            jobs[job_id] = JobStatus(
-                job_id=job_id,
-                stage="error",
-                progress=0,
-                message="Video compositing failed",
-                error=composite_result.error
-            )
-            job_results[job_id] = JobResult(
-                job_id=job_id,
-                success=False,
-                error=composite_result.error
+            await job_store.finish(
+                job_id,
+                JobStatus.model_construct(
+                    job_id=job_id,
+                    stage="error",
+                    progress=0,
+                    message="Video compositing failed",
+                    error=composite_result.error
+                ),
+                JobResult.model_construct(
+                    job_id=job_id,
+                    success=False,
+                    error=composite_result.error
+                )
             )
             return
         
         # Complete
-        jobs[job_id] = JobStatus(
-            job_id=job_id,
-            stage="complete",
-            progress=100,
-            message="Video generation complete"
-        )
-        
-        job_results[job_id] = JobResult(
-            job_id=job_id,
-            success=True,
-            video_url=composite_result.video_url,
-            duration=composite_result.duration
+        await job_store.finish(
+            job_id,
+            JobStatus.model_construct(
+                job_id=job_id,
+                stage="complete",
+                progress=100,
+                message="Video generation complete"
+            ),
+            JobResult.model_construct(
+                job_id=job_id,
+                success=True,
+                video_url=composite_result.video_url,
+                duration=composite_result.duration
+            )
         )
         
     except Exception as e:
         error_msg = str(e)
-        jobs[job_id] = JobStatus(
-            job_id=job_id,
-            stage="error",
-            progress=0,
-            message="Pipeline failed",
-            error=error_msg
-        )
-        job_results[job_id] = JobResult(
-            job_id=job_id,
-            success=False,
-            error=error_msg
+        await job_store.finish(
+            job_id,
+            JobStatus.model_construct(
+                job_id=job_id,
+                stage="error",
+                progress=0,
+                message="Pipeline failed",
+                error=error_msg
+            ),
+            JobResult.model_construct(
+                job_id=job_id,
+                success=False,
+                error=error_msg
+            )
         )
 
 
-@app.post("/api/generate-video")
+@app.post("/api/generate-video", response_model=JobStartedResponse)
 async def generate_video_endpoint(
-    user_input: UserInput,
-    background_tasks: BackgroundTasks
-) -> dict:
+    user_input: UserInput) -> JobStartedResponse:
     """Start full video generation pipeline.
     
     Runs the complete pipeline: storyboard -> frames -> video
@@ -305,27 +394,26 @@ async def generate_video_endpoint(
     
     Args:
         user_input: Brand, product, and video settings.
-        background_tasks: FastAPI background tasks handler.
         
     Returns:
-        Dictionary with job_id for polling progress.
+        JobStartedResponse with job_id for polling progress.
         
     Requirements: 5.1, 5.4
     """
-    job_id = str(uuid.uuid4())
+    job_id = uuid.uuid4().hex
     
     # Initialize job status
-    jobs[job_id] = JobStatus(
+    await job_store.set_status(job_id, JobStatus.model_construct(
         job_id=job_id,
         stage="queued",
         progress=0,
         message="Job queued"
-    )
+    ))
     
     # Start background task
-    background_tasks.add_task(run_video_generation_pipeline, job_id, user_input)
+    start_job_task(job_id, run_video_generation_pipeline(job_id, user_input))
     
-    return {"job_id": job_id, "message": "Video generation started"}
+    return JobStartedResponse(job_id=job_id, message="Video generation started")
 
 
 @app.get("/api/job/{job_id}/status", response_model=JobStatus)
@@ -341,13 +429,124 @@ async def get_job_status(job_id: str) -> JobStatus:
     Raises:
         HTTPException: If job not found.
     """
-    if job_id not in jobs:
+    job_status = await job_store.get_status(job_id)
+    if job_status is None:
+        raise HTTPException(
+            status_code=404,
+            detail={"code": "JOB_NOT_FOUND", "message": f"Job {job_id} not found"}
+        )
+    
+    return job_status
+
+
+@app.delete("/api/job/{job_id}", response_model=JobStatus)
+async def cancel_job(job_id: str) -> JobStatus:
+    """Cancel a job's running pipeline.
+    
+    Stops FIBO/LLM calls and FFmpeg for the job and marks it as failed with
+    a cancellation error. Jobs that have already finished are left as is,
+    and a successful result (e.g. of a job whose frames were being
+    regenerated) is never replaced.
+    
+    Args:
+        job_id: Unique job identifier.
+        
+    Returns:
+        JobStatus after cancellation (or the final status if already finished).
+        
+    Raises:
+        HTTPException: If job not found.
+    """
+    job_status = await job_store.get_status(job_id)
+    if job_status is None:
+        raise HTTPException(
+            status_code=404,
+            detail={"code": "JOB_NOT_FOUND", "message": f"Job {job_id} not found"}
+        )
+    
+    # Tasks that are done but not yet forgotten have nothing left to cancel
+    tasks = {task for task in _job_tasks.get(job_id, ()) if not task.done()}
+    if not tasks:
+        return job_status
+    
+    for task in tasks:
+        task.cancel()
+    await asyncio.wait(tasks)
+    
+    # The pipeline may have finished the job before the cancellation landed
+    current_status = await job_store.get_status(job_id)
+    if current_status is not None and current_status.stage in TERMINAL_STAGES:
+        return current_status
+    
+    job_status = JobStatus.model_construct(
+        job_id=job_id,
+        stage="error",
+        progress=0,
+        message="Job cancelled",
+        error="Cancelled by client"
+    )
+    result = await job_store.get_result(job_id)
+    if result is not None and result.success:
+        await job_store.set_status(job_id, job_status)
+    else:
+        await job_store.finish(job_id, job_status, JobResult.model_construct(
+            job_id=job_id,
+            success=False,
+            error="Cancelled by client"
+        ))
+    return job_status
+
+
+@app.get("/api/job/{job_id}/events")
+async def stream_job_status(job_id: str) -> StreamingResponse:
+    """Stream a job's status changes as Server-Sent Events.
+    
+    Push alternative to polling /api/job/{job_id}/status: sends the current
+    status immediately, then one event per stage transition, and closes
+    once the job is complete or has failed (or has expired in the meantime).
+    
+    Args:
+        job_id: Unique job identifier.
+        
+    Returns:
+        text/event-stream response whose events carry JobStatus JSON.
+        
+    Raises:
+        HTTPException: If job not found.
+    """
+    if await job_store.get_status(job_id) is None:
         raise HTTPException(
             status_code=404,
             detail={"code": "JOB_NOT_FOUND", "message": f"Job {job_id} not found"}
         )
     
-    return jobs[job_id]
+    async def events():
+        # Subscribe before reading the current status so no transition is missed
+        queue = job_store.subscribe(job_id)
+        try:
+            job_status = await job_store.get_status(job_id)
+            if job_status is None:
+                # Expired or evicted since the check above; a reconnect gets the 404
+                return
+            while True:
+                yield f"data: {job_status.model_dump_json()}\n\n"
+                if job_status.stage in TERMINAL_STAGES:
+                    return
+                while True:
+                    try:
+                        job_status = await asyncio.wait_for(queue.get(), JOB_EVENTS_KEEPALIVE)
+                        break
+                    except asyncio.TimeoutError:
+                        # Keep proxies from closing an idle stream
+                        yield ": keepalive\n\n"
+        finally:
+            job_store.unsubscribe(job_id, queue)
+    
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache"}
+    )
 
 
 @app.get("/api/job/{job_id}/result", response_model=JobResult)
@@ -365,13 +564,13 @@ async def get_job_result(job_id: str) -> JobResult:
         
     Requirements: 5.4
     """
-    if job_id not in jobs:
+    job_status = await job_store.get_status(job_id)
+    if job_status is None:
         raise HTTPException(
             status_code=404,
             detail={"code": "JOB_NOT_FOUND", "message": f"Job {job_id} not found"}
         )
     
-    job_status = jobs[job_id]
     
     if job_status.stage not in ["complete", "error"]:
         raise HTTPException(
@@ -382,13 +581,14 @@ async def get_job_result(job_id: str) -> JobResult:
             }
         )
     
-    if job_id not in job_results:
+    job_result = await job_store.get_result(job_id)
+    if job_result is None:
         raise HTTPException(
             status_code=500,
             detail={"code": "RESULT_NOT_FOUND", "message": "Job result not available"}
         )
     
-    return job_results[job_id]
+    return job_result
 
 
 @app.get("/api/videos/{filename}")
@@ -406,26 +606,38 @@ async def serve_video(filename: str):
         
     Requirements: 5.4
     """
-    # Extract job_id from filename
-    if not filename.endswith(".mp4"):
+    # Extract job_id from filename; anything else never reaches the filesystem
+    match = VIDEO_FILENAME_RE.fullmatch(filename)
+    if match is None:
         raise HTTPException(
             status_code=400,
             detail={"code": "INVALID_FILENAME", "message": "Invalid video filename"}
         )
     
-    job_id = filename[:-4]  # Remove .mp4 extension
+    job_id = match.group(1)
     video_path = get_video_compositor_service().get_video_path(job_id)
     
-    if not video_path.exists():
+    # One stat serves both the existence check and FileResponse's
+    # Content-Length/ETag headers (it would otherwise stat again in a thread)
+    try:
+        video_stat = video_path.stat()
+    except FileNotFoundError:
+        video_stat = None
+    if video_stat is None or not stat.S_ISREG(video_stat.st_mode):
         raise HTTPException(
             status_code=404,
             detail={"code": "VIDEO_NOT_FOUND", "message": "Video file not found"}
         )
     
+    # FileResponse already answers Range requests with 206 partial content
+    # (so players can seek) and streams the file off the event loop. Each
+    # job writes its video once under a unique id, so clients may cache it.
     return FileResponse(
         path=str(video_path),
         media_type="video/mp4",
-        filename=filename
+        filename=filename,
+        headers={"Cache-Control": VIDEO_CACHE_CONTROL},
+        stat_result=video_stat
     )
 
 
@@ -465,7 +677,7 @@ async def generate_storyboard_v2_endpoint(user_input: EnhancedUserInput) -> Enha
         )
     except Exception as e:
         error_message = str(e)
-        if "api_key" in error_message.lower() or "authentication" in error_message.lower():
+        if is_auth_error_message(error_message):
             raise HTTPException(
                 status_code=500,
                 detail={"code": "API_KEY_ERROR", "message": "OpenAI API key configuration error", "retryable": False}
@@ -492,55 +704,59 @@ async def run_video_generation_pipeline_v2(job_id: str, user_input: EnhancedUser
     """
     try:
         # Stage 1: Generate enhanced storyboard
-        jobs[job_id] = JobStatus(
+        await job_store.set_status(job_id, JobStatus.model_construct(
             job_id=job_id,
             stage="storyboard",
             progress=10,
             message="Generating enhanced storyboard..."
-        )
-        
-        storyboard = await generate_enhanced_storyboard(user_input)
-        job_enhanced_storyboards[job_id] = storyboard
+        ))
         
-        jobs[job_id] = JobStatus(
-            job_id=job_id,
-            stage="storyboard",
-            progress=25,
-            message="Enhanced storyboard generated"
+        # Start each scene's frame as soon as it streams in, and open FIBO
+        # connections while the LLM writes the storyboard
+        frame_batch = get_enhanced_frame_generator().start_batch(
+            user_input.aspect_ratio, job_id
         )
+        try:
+            storyboard, _ = await asyncio.gather(
+                generate_enhanced_storyboard(user_input, on_scene=frame_batch.add),
+                get_fibo_client().warm_up()
+            )
+        except BaseException:
+            frame_batch.cancel()
+            raise
+        await job_store.set_enhanced_storyboard(job_id, storyboard)
         
         # Stage 2: Generate frames using structured prompts
-        jobs[job_id] = JobStatus(
+        await job_store.set_status(job_id, JobStatus.model_construct(
             job_id=job_id,
             stage="frame-generation",
             progress=30,
             message="Generating frames with structured prompts..."
-        )
+        ))
         
-        frame_generator = get_enhanced_frame_generator()
-        frame_result = await frame_generator.generate_all_frames(
-            storyboard=storyboard,
-            job_id=job_id
-        )
+        frame_result = await frame_batch.result(storyboard)
         
         if not frame_result.success:
             error_msg = "; ".join(frame_result.errors) if frame_result.errors else "Frame generation failed"
-            jobs[job_id] = JobStatus(
-                job_id=job_id,
-                stage="error",
-                progress=0,
-                message="Frame generation failed",
-                error=error_msg
-            )
-            job_results[job_id] = JobResult(
-                job_id=job_id,
-                success=False,
-                error=error_msg
+            await job_store.finish(
+                job_id,
+                JobStatus.model_construct(
+                    job_id=job_id,
+                    stage="error",
+                    progress=0,
+                    message="Frame generation failed",
+                    error=error_msg
+                ),
+                JobResult.model_construct(
+                    job_id=job_id,
+                    success=False,
+                    error=error_msg
+                )
             )
             return
         
         # Store frames for later regeneration (convert to EnhancedGeneratedFrame dict)
-        job_enhanced_frames[job_id] = {
+        await job_store.set_enhanced_frames(job_id, {
             frame.scene_number: EnhancedGeneratedFrame(
                 scene_number=frame.scene_number,
                 image_url=frame.image_url,
@@ -548,22 +764,15 @@ async def run_video_generation_pipeline_v2(job_id: str, user_input: EnhancedUser
                 parameters_hash=""  # Will be computed on regeneration
             )
             for frame in frame_result.frames
-        }
-        
-        jobs[job_id] = JobStatus(
-            job_id=job_id,
-            stage="frame-generation",
-            progress=70,
-            message=f"Generated {len(frame_result.frames)} frames"
-        )
+        })
         
         # Stage 3: Composite video
-        jobs[job_id] = JobStatus(
+        await job_store.set_status(job_id, JobStatus.model_construct(
             job_id=job_id,
             stage="compositing",
             progress=75,
             message="Compositing video..."
-        )
+        ))
         
         composite_result = await get_video_compositor_service().composite(
             frames=frame_result.frames,
@@ -572,56 +781,62 @@ async def run_video_generation_pipeline_v2(job_id: str, user_input: EnhancedUser
         )
         
         if not composite_result.success:
-            jobs[job_id] = JobStatus(
-                job_id=job_id,
-                stage="error",
-                progress=0,
-                message="Video compositing failed",
-                error=composite_result.error
-            )
-            job_results[job_id] = JobResult(
-                job_id=job_id,
-                success=False,
-                error=composite_result.error
+            await job_store.finish(
+                job_id,
+                JobStatus.model_construct(
+                    job_id=job_id,
+                    stage="error",
+                    progress=0,
+                    message="Video compositing failed",
+                    error=composite_result.error
+                ),
+                JobResult.model_construct(
+                    job_id=job_id,
+                    success=False,
+                    error=composite_result.error
+                )
             )
             return
         
         # Complete
-        jobs[job_id] = JobStatus(
-            job_id=job_id,
-            stage="complete",
-            progress=100,
-            message="Video generation complete"
-        )
-        
-        job_results[job_id] = JobResult(
-            job_id=job_id,
-            success=True,
-            video_url=composite_result.video_url,
-            duration=composite_result.duration
+        await job_store.finish(
+            job_id,
+            JobStatus.model_construct(
+                job_id=job_id,
+                stage="complete",
+                progress=100,
+                message="Video generation complete"
+            ),
+            JobResult.model_construct(
+                job_id=job_id,
+                success=True,
+                video_url=composite_result.video_url,
+                duration=composite_result.duration
+            )
         )
         
     except Exception as e:
         error_msg = str(e)
-        jobs[job_id] = JobStatus(
-            job_id=job_id,
-            stage="error",
-            progress=0,
-            message="Pipeline failed",
-            error=error_msg
-        )
-        job_results[job_id] = JobResult(
-            job_id=job_id,
-            success=False,
-            error=error_msg
+        await job_store.finish(
+            job_id,
+            JobStatus.model_construct(
+                job_id=job_id,
+                stage="error",
+                progress=0,
+                message="Pipeline failed",
+                error=error_msg
+            ),
+            JobResult.model_construct(
+                job_id=job_id,
+                success=False,
+                error=error_msg
+            )
         )
 
 
-@app.post("/api/v2/generate-video")
+@app.post("/api/v2/generate-video", response_model=JobStartedResponse)
 async def generate_video_v2_endpoint(
-    user_input: EnhancedUserInput,
-    background_tasks: BackgroundTasks
-) -> dict:
+    user_input: EnhancedUserInput) -> JobStartedResponse:
     """Start enhanced v2 video generation pipeline.
     
     Runs the complete v2 pipeline with structured FIBO JSON:
@@ -631,35 +846,32 @@ async def generate_video_v2_endpoint(
     
     Args:
         user_input: Enhanced user input with material and color preferences.
-        background_tasks: FastAPI background tasks handler.
         
     Returns:
-        Dictionary with job_id for polling progress.
+        JobStartedResponse with job_id for polling progress.
         
     Requirements: 1.1, 7.1, 7.2
     """
-    job_id = str(uuid.uuid4())
+    job_id = uuid.uuid4().hex
     
     # Initialize job status
-    jobs[job_id] = JobStatus(
+    await job_store.set_status(job_id, JobStatus.model_construct(
         job_id=job_id,
         stage="queued",
         progress=0,
         message="Job queued"
-    )
+    ))
     
     # Start background task
-    background_tasks.add_task(run_video_generation_pipeline_v2, job_id, user_input)
+    start_job_task(job_id, run_video_generation_pipeline_v2(job_id, user_input))
     
-    return {"job_id": job_id, "message": "Video generation started (v2 pipeline)"}
+    return JobStartedResponse(job_id=job_id, message="Video generation started (v2 pipeline)")
 
 
-@app.post("/api/v2/modify-parameter/{job_id}")
+@app.post("/api/v2/modify-parameter/{job_id}", response_model=ParameterModificationResponse)
 async def modify_parameter_endpoint(
     job_id: str,
-    modification: ParameterModification,
-    background_tasks: BackgroundTasks
-) -> dict:
+    modification: ParameterModification) -> ParameterModificationResponse:
     """Modify a single parameter in a job's storyboard and regenerate affected frames.
     
     Enables quick iteration by changing a single parameter (e.g., material, color)
@@ -668,10 +880,9 @@ async def modify_parameter_endpoint(
     Args:
         job_id: Unique job identifier.
         modification: Parameter modification request with path, value, and target scenes.
-        background_tasks: FastAPI background tasks handler.
         
     Returns:
-        Dictionary with modification result and regeneration status.
+        ParameterModificationResponse with modified scenes and frames to regenerate.
         
     Raises:
         HTTPException: If job not found or modification fails.
@@ -679,7 +890,8 @@ async def modify_parameter_endpoint(
     Requirements: 4.1, 4.2, 4.3, 4.4, 7.1
     """
     # Check if job exists and has an enhanced storyboard
-    if job_id not in job_enhanced_storyboards:
+    storyboard = await job_store.get_enhanced_storyboard(job_id)
+    if storyboard is None:
         raise HTTPException(
             status_code=404,
             detail={
@@ -688,8 +900,6 @@ async def modify_parameter_endpoint(
             }
         )
     
-    storyboard = job_enhanced_storyboards[job_id]
-    
     # Apply the modification
     modified_storyboard, result = apply_parameter_modification(storyboard, modification)
     
@@ -703,32 +913,31 @@ async def modify_parameter_endpoint(
         )
     
     # Update the stored storyboard
-    job_enhanced_storyboards[job_id] = modified_storyboard
+    await job_store.set_enhanced_storyboard(job_id, modified_storyboard)
     
     # If there are frames to regenerate, start background task
     if result.frames_to_regenerate:
         # Update job status
-        jobs[job_id] = JobStatus(
+        await job_store.set_status(job_id, JobStatus.model_construct(
             job_id=job_id,
             stage="frame-generation",
             progress=50,
             message=f"Regenerating {len(result.frames_to_regenerate)} frames..."
-        )
+        ))
         
         # Start regeneration in background
-        background_tasks.add_task(
-            regenerate_frames_for_modification,
+        start_job_task(job_id, regenerate_frames_for_modification(
             job_id,
             modified_storyboard,
             result.frames_to_regenerate
-        )
+        ))
     
-    return {
-        "success": True,
-        "modified_scenes": result.modified_scenes,
-        "frames_to_regenerate": result.frames_to_regenerate,
-        "message": f"Modified {len(result.modified_scenes)} scenes, regenerating {len(result.frames_to_regenerate)} frames"
-    }
+    return ParameterModificationResponse(
+        success=True,
+        modified_scenes=result.modified_scenes,
+        frames_to_regenerate=result.frames_to_regenerate,
+        message=f"Modified {len(result.modified_scenes)} scenes, regenerating {len(result.frames_to_regenerate)} frames"
+    )
 
 
 async def regenerate_frames_for_modification(
@@ -749,7 +958,7 @@ async def regenerate_frames_for_modification(
         frame_generator = get_enhanced_frame_generator()
         
         # Get existing frames if available
-        existing_frames = job_enhanced_frames.get(job_id, {})
+        existing_frames = await job_store.get_enhanced_frames(job_id)
         
         # Regenerate only the modified frames
         updated_frames = await frame_generator.regenerate_modified_frames(
@@ -760,24 +969,24 @@ async def regenerate_frames_for_modification(
         )
         
         # Store updated frames
-        job_enhanced_frames[job_id] = updated_frames
+        await job_store.set_enhanced_frames(job_id, updated_frames)
         
         # Update job status
-        jobs[job_id] = JobStatus(
+        await job_store.set_status(job_id, JobStatus.model_construct(
             job_id=job_id,
             stage="complete",
             progress=100,
             message=f"Regenerated {len(scenes_to_regenerate)} frames"
-        )
+        ))
         
     except Exception as e:
-        jobs[job_id] = JobStatus(
+        await job_store.set_status(job_id, JobStatus.model_construct(
             job_id=job_id,
             stage="error",
             progress=0,
             message="Frame regeneration failed",
             error=str(e)
-        )
+        ))
 
 
 class RegenerateVideoRequest(BaseModel):
@@ -785,12 +994,10 @@ class RegenerateVideoRequest(BaseModel):
     scenes_to_regenerate: list[int] = []  # Empty means regenerate all modified
 
 
-@app.post("/api/v2/regenerate-video/{job_id}")
+@app.post("/api/v2/regenerate-video/{job_id}", response_model=JobStartedResponse)
 async def regenerate_video_endpoint(
     job_id: str,
-    request: RegenerateVideoRequest,
-    background_tasks: BackgroundTasks
-) -> dict:
+    request: RegenerateVideoRequest) -> JobStartedResponse:
     """Regenerate video with modified frame parameters.
     
     Regenerates only the specified frames (or all modified frames),
@@ -799,17 +1006,17 @@ async def regenerate_video_endpoint(
     Args:
         job_id: Original job identifier.
         request: Scenes to regenerate.
-        background_tasks: FastAPI background tasks handler.
         
     Returns:
-        Dictionary with new job_id for polling progress.
+        JobStartedResponse with the new job_id for polling progress.
         
     Raises:
         HTTPException: If job not found.
         
     Requirements: 4.1, 4.2, 4.3, 4.4
     """
-    if job_id not in job_enhanced_storyboards:
+    storyboard = await job_store.get_enhanced_storyboard(job_id)
+    if storyboard is None:
         raise HTTPException(
             status_code=404,
             detail={
@@ -819,33 +1026,34 @@ async def regenerate_video_endpoint(
         )
     
     # Create a new job for the regeneration
-    new_job_id = str(uuid.uuid4())
+    new_job_id = uuid.uuid4().hex
     
     # Copy the storyboard to the new job
-    storyboard = job_enhanced_storyboards[job_id]
-    job_enhanced_storyboards[new_job_id] = storyboard
+    await job_store.set_enhanced_storyboard(new_job_id, storyboard)
     
     # Initialize job status
-    jobs[new_job_id] = JobStatus(
+    await job_store.set_status(new_job_id, JobStatus.model_construct(
         job_id=new_job_id,
         stage="queued",
         progress=0,
         message="Regeneration job queued"
-    )
+    ))
     
     # Determine which scenes to regenerate
     scenes = request.scenes_to_regenerate if request.scenes_to_regenerate else list(range(1, len(storyboard.scenes) + 1))
     
     # Start background task
-    background_tasks.add_task(
-        run_video_regeneration_pipeline,
+    start_job_task(new_job_id, run_video_regeneration_pipeline(
         new_job_id,
         job_id,
         storyboard,
         scenes
-    )
+    ))
     
-    return {"job_id": new_job_id, "message": f"Video regeneration started for {len(scenes)} scenes"}
+    return JobStartedResponse(
+        job_id=new_job_id,
+        message=f"Video regeneration started for {len(scenes)} scenes"
+    )
 
 
 async def run_video_regeneration_pipeline(
@@ -866,17 +1074,17 @@ async def run_video_regeneration_pipeline(
     """
     try:
         # Stage 1: Regenerate frames
-        jobs[new_job_id] = JobStatus(
+        await job_store.set_status(new_job_id, JobStatus.model_construct(
             job_id=new_job_id,
             stage="frame-generation",
             progress=20,
             message=f"Regenerating {len(scenes_to_regenerate)} frames..."
-        )
+        ))
         
         frame_generator = get_enhanced_frame_generator()
         
         # Get existing frames from original job if available
-        existing_frames = job_enhanced_frames.get(original_job_id, {})
+        existing_frames = await job_store.get_enhanced_frames(original_job_id)
         
         # Regenerate the modified frames
         updated_frames = await frame_generator.regenerate_modified_frames(
@@ -887,22 +1095,15 @@ async def run_video_regeneration_pipeline(
         )
         
         # Store updated frames for new job
-        job_enhanced_frames[new_job_id] = updated_frames
-        
-        jobs[new_job_id] = JobStatus(
-            job_id=new_job_id,
-            stage="frame-generation",
-            progress=70,
-            message=f"Regenerated {len(scenes_to_regenerate)} frames"
-        )
+        await job_store.set_enhanced_frames(new_job_id, updated_frames)
         
         # Stage 2: Recomposite video
-        jobs[new_job_id] = JobStatus(
+        await job_store.set_status(new_job_id, JobStatus.model_construct(
             job_id=new_job_id,
             stage="compositing",
             progress=75,
             message="Compositing video with new frames..."
-        )
+        ))
         
         # Convert EnhancedGeneratedFrame dict to GeneratedFrame list for compositor
         frames_list = [
@@ -922,57 +1123,66 @@ async def run_video_regeneration_pipeline(
         )
         
         if not composite_result.success:
-            jobs[new_job_id] = JobStatus(
-                job_id=new_job_id,
-                stage="error",
-                progress=0,
-                message="Video compositing failed",
-                error=composite_result.error
-            )
-            job_results[new_job_id] = JobResult(
-                job_id=new_job_id,
-                success=False,
-                error=composite_result.error
+            await job_store.finish(
+                new_job_id,
+                JobStatus.model_construct(
+                    job_id=new_job_id,
+                    stage="error",
+                    progress=0,
+                    message="Video compositing failed",
+                    error=composite_result.error
+                ),
+                JobResult.model_construct(
+                    job_id=new_job_id,
+                    success=False,
+                    error=composite_result.error
+                )
             )
             return
         
         # Complete
-        jobs[new_job_id] = JobStatus(
-            job_id=new_job_id,
-            stage="complete",
-            progress=100,
-            message="Video regeneration complete"
-        )
-        
-        job_results[new_job_id] = JobResult(
-            job_id=new_job_id,
-            success=True,
-            video_url=composite_result.video_url,
-            duration=composite_result.duration
+        await job_store.finish(
+            new_job_id,
+            JobStatus.model_construct(
+                job_id=new_job_id,
+                stage="complete",
+                progress=100,
+                message="Video regeneration complete"
+            ),
+            JobResult.model_construct(
+                job_id=new_job_id,
+                success=True,
+                video_url=composite_result.video_url,
+                duration=composite_result.duration
+            )
         )
         
     except Exception as e:
         error_msg = str(e)
-        jobs[new_job_id] = JobStatus(
-            job_id=new_job_id,
-            stage="error",
-            progress=0,
-            message="Regeneration pipeline failed",
-            error=error_msg
-        )
-        job_results[new_job_id] = JobResult(
-            job_id=new_job_id,
-            success=False,
-            error=error_msg
+        await job_store.finish(
+            new_job_id,
+            JobStatus.model_construct(
+                job_id=new_job_id,
+                stage="error",
+                progress=0,
+                message="Regeneration pipeline failed",
+                error=error_msg
+            ),
+            JobResult.model_construct(
+                job_id=new_job_id,
+                success=False,
+                error=error_msg
+            )
         )
 
 
 @app.get("/api/v2/job/{job_id}/parameters", response_model=EnhancedStoryboard)
-async def get_job_parameters_endpoint(job_id: str) -> EnhancedStoryboard:
+async def get_job_parameters_endpoint(job_id: str) -> Response:
     """Get the current storyboard parameters for a v2 job.
     
     Returns the full EnhancedStoryboard with all scene parameters,
     useful for displaying current settings in the parameter editor.
+    The JSON is cached by the job store until the parameters change.
     
     Args:
         job_id: Unique job identifier.
@@ -985,7 +1195,8 @@ async def get_job_parameters_endpoint(job_id: str) -> EnhancedStoryboard:
         
     Requirements: 7.1, 7.2
     """
-    if job_id not in job_enhanced_storyboards:
+    storyboard_json = await job_store.get_enhanced_storyboard_json(job_id)
+    if storyboard_json is None:
         raise HTTPException(
             status_code=404,
             detail={
@@ -994,4 +1205,4 @@ async def get_job_parameters_endpoint(job_id: str) -> EnhancedStoryboard:
             }
         )
     
-    return job_enhanced_storyboards[job_id]
+    return Response(content=storyboard_json, media_type="application/json")
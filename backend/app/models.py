@@ -1,6 +1,6 @@
 """Pydantic models for FabFlow Studio storyboard generation."""
 from typing import Literal, Optional, Any
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field
 
 
 # =============================================================================
@@ -96,14 +96,6 @@ class EnhancedUserInput(BaseModel):
         default=None, description="Overall style mood"
     )
 
-    @field_validator("duration")
-    @classmethod
-    def validate_duration(cls, v: int) -> int:
-        """Validate duration is within allowed range."""
-        if v < 5 or v > 12:
-            raise ValueError("Duration must be between 5 and 12 seconds")
-        return v
-
 
 class EnhancedStoryboard(BaseModel):
     """Storyboard with structured FIBO parameters."""
@@ -124,14 +116,6 @@ class EnhancedStoryboard(BaseModel):
         default=None, description="Global color palette override"
     )
 
-    @field_validator("scenes")
-    @classmethod
-    def validate_scenes(cls, v: list[SceneParameters]) -> list[SceneParameters]:
-        """Validate scene count is within allowed range."""
-        if len(v) < 3 or len(v) > 5:
-            raise ValueError("Storyboard must contain 3-5 scenes")
-        return v
-
 
 # =============================================================================
 # Original Models (v1)
@@ -152,14 +136,6 @@ class UserInput(BaseModel):
         default=None, description="Optional product image URL for reference"
     )
 
-    @field_validator("duration")
-    @classmethod
-    def validate_duration(cls, v: int) -> int:
-        """Validate duration is within allowed range."""
-        if v < 5 or v > 12:
-            raise ValueError("Duration must be between 5 and 12 seconds")
-        return v
-
 
 class FIBOPrompt(BaseModel):
     """FIBO-compatible prompt for image generation."""
@@ -199,11 +175,3 @@ class Storyboard(BaseModel):
     total_duration: int = Field(..., ge=5, le=12, description="Total video duration in seconds")
     aspect_ratio: Literal["9:16", "1:1", "16:9"] = Field(..., description="Video aspect ratio")
     scenes: list[Scene] = Field(..., min_length=3, max_length=5, description="List of 3-5 scenes")
-
-    @field_validator("scenes")
-    @classmethod
-    def validate_scenes(cls, v: list[Scene]) -> list[Scene]:
-        """Validate scene count is within allowed range."""
-        if len(v) < 3 or len(v) > 5:
-            raise ValueError("Storyboard must contain 3-5 scenes")
-        return v
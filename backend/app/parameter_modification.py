@@ -5,7 +5,6 @@ without full regeneration, supporting quick iteration on product visuals.
 
 Requirements: 4.1, 4.2, 4.3, 4.4
 """
-from copy import deepcopy
 from typing import Any, Optional, Union
 
 from pydantic import BaseModel, Field
@@ -105,39 +104,42 @@ def _get_nested_value(obj: Any, path: str) -> Any:
     return current
 
 
-def _set_nested_value(obj: Any, path: str, value: Any) -> None:
-    """Set a nested value in an object using dot notation.
+def _replace_nested_value(obj: Any, path: str, value: Any, full_path: Optional[str] = None) -> Any:
+    """Return a copy of an object with a nested value replaced, using dot notation.
     
-    Modifies the object in place.
+    Copy-on-write: only the objects along the path are copied; everything
+    else is shared with the original, which is left unchanged.
     
     Args:
-        obj: The object to modify (can be dict or Pydantic model).
+        obj: The object to copy (can be dict or Pydantic model).
         path: Dot-notation path (e.g., "style.material").
         value: The value to set.
+        full_path: Path reported in errors (defaults to path).
+        
+    Returns:
+        The updated copy of obj.
         
     Raises:
         KeyError: If the path doesn't exist.
     """
-    parts = path.split(".")
-    current = obj
-    
-    # Navigate to the parent of the target
-    for part in parts[:-1]:
-        if isinstance(current, dict):
-            current = current[part]
-        elif hasattr(current, part):
-            current = getattr(current, part)
-        else:
-            raise KeyError(f"Path '{path}' not found: '{part}' doesn't exist")
+    full_path = full_path or path
+    key, _, rest = path.partition(".")
     
-    # Set the final value
-    final_key = parts[-1]
-    if isinstance(current, dict):
-        current[final_key] = value
-    elif hasattr(current, final_key):
-        setattr(current, final_key, value)
+    if isinstance(obj, dict):
+        if key not in obj:
+            raise KeyError(f"Path '{full_path}' not found: '{key}' doesn't exist")
+        child = obj[key]
+    elif isinstance(obj, BaseModel) and key in type(obj).model_fields:
+        child = getattr(obj, key)
     else:
-        raise KeyError(f"Path '{path}' not found: '{final_key}' doesn't exist")
+        raise KeyError(f"Path '{full_path}' not found: '{key}' doesn't exist")
+    
+    if rest:
+        value = _replace_nested_value(child, rest, value, full_path)
+    
+    if isinstance(obj, dict):
+        return {**obj, key: value}
+    return obj.model_copy(update={key: value})
 
 
 def _extract_preserved_parameters(scene: SceneParameters, modified_path: str) -> dict:
@@ -197,71 +199,60 @@ def apply_parameter_modification(
         
     Returns:
         Tuple of (modified_storyboard, modification_result).
-        The modified_storyboard is a deep copy with the change applied.
+        The modified_storyboard is a copy with the change applied; the
+        original storyboard is never mutated. Only the modified scenes and
+        the models on the modified path are copied, so unchanged scenes and
+        parameter groups are shared with the original.
         The modification_result contains information about what was changed.
         
     Requirements: 4.1, 4.2, 4.3, 4.4
     """
-    # Create a deep copy to avoid mutating the original
-    modified_storyboard = storyboard.model_copy(deep=True)
-    
     # Determine which scenes to modify
     if modification.apply_to_scenes:
-        target_scenes = modification.apply_to_scenes
+        target_scenes = set(modification.apply_to_scenes)
     else:
         # Empty list means all scenes
-        target_scenes = [scene.scene_number for scene in modified_storyboard.scenes]
+        target_scenes = {scene.scene_number for scene in storyboard.scenes}
     
     modified_scenes: list[int] = []
     frames_to_regenerate: list[int] = []
     preserved_parameters: dict = {}
     
+    # Storyboard-level fields to update alongside the scenes
+    storyboard_update: dict[str, Any] = {}
+    
+    # Global parameters also update the matching style field of each target scene
+    if modification.parameter_path == "global_material":
+        storyboard_update["global_material"] = modification.new_value
+        scene_path = "style.material"
+    elif modification.parameter_path == "global_color_palette":
+        storyboard_update["global_color_palette"] = modification.new_value
+        scene_path = "style.color_palette"
+    elif modification.parameter_path.startswith("global_"):
+        return storyboard.model_copy(), ModificationResult(
+            success=False,
+            error=f"Unknown global parameter: {modification.parameter_path}"
+        )
+    else:
+        scene_path = modification.parameter_path
+    
     try:
-        # Handle global parameters
-        if modification.parameter_path.startswith("global_"):
-            if modification.parameter_path == "global_material":
-                modified_storyboard.global_material = modification.new_value
-                # Also update all target scenes' style.material
-                for scene in modified_storyboard.scenes:
-                    if scene.scene_number in target_scenes:
-                        preserved_parameters[scene.scene_number] = _extract_preserved_parameters(
-                            scene, "style.material"
-                        )
-                        scene.style.material = modification.new_value
-                        modified_scenes.append(scene.scene_number)
-                        frames_to_regenerate.append(scene.scene_number)
-                        
-            elif modification.parameter_path == "global_color_palette":
-                modified_storyboard.global_color_palette = modification.new_value
-                # Also update all target scenes' style.color_palette
-                for scene in modified_storyboard.scenes:
-                    if scene.scene_number in target_scenes:
-                        preserved_parameters[scene.scene_number] = _extract_preserved_parameters(
-                            scene, "style.color_palette"
-                        )
-                        scene.style.color_palette = modification.new_value
-                        modified_scenes.append(scene.scene_number)
-                        frames_to_regenerate.append(scene.scene_number)
-            else:
-                return modified_storyboard, ModificationResult(
-                    success=False,
-                    error=f"Unknown global parameter: {modification.parameter_path}"
+        scenes: list[SceneParameters] = []
+        for scene in storyboard.scenes:
+            if scene.scene_number in target_scenes:
+                # Capture preserved parameters before modification
+                preserved_parameters[scene.scene_number] = _extract_preserved_parameters(
+                    scene, scene_path
                 )
-        else:
-            # Handle scene-level parameters
-            for scene in modified_storyboard.scenes:
-                if scene.scene_number in target_scenes:
-                    # Capture preserved parameters before modification
-                    preserved_parameters[scene.scene_number] = _extract_preserved_parameters(
-                        scene, modification.parameter_path
-                    )
-                    
-                    # Apply the modification
-                    _set_nested_value(scene, modification.parameter_path, modification.new_value)
-                    modified_scenes.append(scene.scene_number)
-                    frames_to_regenerate.append(scene.scene_number)
+                
+                # Apply the modification to a copy of the scene
+                scene = _replace_nested_value(scene, scene_path, modification.new_value)
+                modified_scenes.append(scene.scene_number)
+                frames_to_regenerate.append(scene.scene_number)
+            scenes.append(scene)
         
-        return modified_storyboard, ModificationResult(
+        storyboard_update["scenes"] = scenes
+        return storyboard.model_copy(update=storyboard_update), ModificationResult(
             success=True,
             modified_scenes=modified_scenes,
             frames_to_regenerate=frames_to_regenerate,
@@ -269,12 +260,12 @@ def apply_parameter_modification(
         )
         
     except KeyError as e:
-        return modified_storyboard, ModificationResult(
+        return storyboard.model_copy(), ModificationResult(
             success=False,
             error=str(e)
         )
     except Exception as e:
-        return modified_storyboard, ModificationResult(
+        return storyboard.model_copy(), ModificationResult(
             success=False,
             error=f"Failed to apply modification: {str(e)}"
         )
@@ -1,9 +1,18 @@
 """OpenAI-powered storyboard generator for FabFlow Studio."""
-import json
-from openai import AsyncOpenAI
+from typing import Callable, Optional
+
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient
+from pydantic import ValidationError
 
 from app.config import get_settings
-from app.models import UserInput, Storyboard, EnhancedUserInput, EnhancedStoryboard
+from app.fibo_client import HTTP2_AVAILABLE
+from app.models import (
+    UserInput,
+    Storyboard,
+    EnhancedUserInput,
+    EnhancedStoryboard,
+    SceneParameters,
+)
 
 STORYBOARD_SYSTEM_PROMPT = """You are an expert advertising creative director. Your task is to generate compelling video ad storyboards for Instagram.
 
@@ -40,6 +49,35 @@ Video Settings:
 Generate a storyboard with 3-5 scenes. Distribute the {duration} seconds across all scenes."""
 
 
+# Shared OpenAI client so storyboard calls reuse pooled connections
+# (lazy initialization, like the FIBO client)
+_openai_client: Optional[AsyncOpenAI] = None
+
+
+def get_openai_client() -> AsyncOpenAI:
+    """Get or create the shared OpenAI client.
+    
+    Uses HTTP/2 when the h2 package is installed, so concurrent jobs'
+    storyboard calls share one connection; the SDK's timeouts and pool
+    limits are kept.
+    """
+    global _openai_client
+    if _openai_client is None:
+        _openai_client = AsyncOpenAI(
+            api_key=get_settings().openai_api_key,
+            http_client=DefaultAsyncHttpxClient(http2=HTTP2_AVAILABLE)
+        )
+    return _openai_client
+
+
+async def close_openai_client() -> None:
+    """Close the shared OpenAI client's connection pool, if one was created."""
+    global _openai_client
+    if _openai_client is not None:
+        await _openai_client.close()
+        _openai_client = None
+
+
 def build_storyboard_prompt(user_input: UserInput) -> str:
     """Build the user prompt for storyboard generation."""
     return STORYBOARD_USER_TEMPLATE.format(
@@ -118,8 +156,7 @@ async def generate_storyboard(user_input: UserInput) -> Storyboard:
         ValueError: If OpenAI response cannot be parsed into a valid Storyboard.
         Exception: If OpenAI API call fails.
     """
-    settings = get_settings()
-    client = AsyncOpenAI(api_key=settings.openai_api_key)
+    client = get_openai_client()
     
     user_prompt = build_storyboard_prompt(user_input)
     
@@ -144,8 +181,8 @@ async def generate_storyboard(user_input: UserInput) -> Storyboard:
     if not content:
         raise ValueError("OpenAI returned empty response")
     
-    storyboard_data = json.loads(content)
-    return Storyboard.model_validate(storyboard_data)
+    # Parse and validate in one pass in pydantic-core
+    return Storyboard.model_validate_json(content)
 
 
 # =============================================================================
@@ -329,16 +366,68 @@ ENHANCED_STORYBOARD_JSON_SCHEMA = {
 }
 
 
-async def generate_enhanced_storyboard(user_input: EnhancedUserInput) -> EnhancedStoryboard:
+class _SceneScanner:
+    """Finds complete scene objects in a storyboard JSON document as it streams.
+    
+    Scenes are the only objects that sit directly inside an array of the
+    root object, i.e. objects opened at nesting depth 2. Braces inside
+    strings are ignored.
+    """
+    
+    def __init__(self):
+        """Initialize an empty scanner."""
+        self.text = ""
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+        self._scene_start = 0
+    
+    def feed(self, chunk: str) -> list[str]:
+        """Append streamed text and return the JSON of scenes it completed."""
+        start = len(self.text)
+        self.text += chunk
+        scenes = []
+        for i in range(start, len(self.text)):
+            char = self.text[i]
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif char == "\\":
+                    self._escaped = True
+                elif char == '"':
+                    self._in_string = False
+            elif char == '"':
+                self._in_string = True
+            elif char == "{" or char == "[":
+                if char == "{" and self._depth == 2:
+                    self._scene_start = i
+                self._depth += 1
+            elif char == "}" or char == "]":
+                self._depth -= 1
+                if char == "}" and self._depth == 2:
+                    scenes.append(self.text[self._scene_start:i + 1])
+        return scenes
+
+
+async def generate_enhanced_storyboard(
+    user_input: EnhancedUserInput,
+    on_scene: Optional[Callable[[SceneParameters], None]] = None
+) -> EnhancedStoryboard:
     """Generate a storyboard with structured FIBO parameters using OpenAI GPT-4o.
     
     This enhanced version generates storyboards with precise camera, lighting,
     composition, and style parameters that map directly to FIBO's structured
     prompt format for deterministic, high-quality product shots.
     
+    The response is streamed, and each scene is passed to on_scene as soon
+    as it is complete, so callers can start work on early scenes while the
+    rest of the storyboard is still being written.
+    
     Args:
         user_input: Enhanced user input containing brand, product, video settings,
                    and optional material/color preferences.
+        on_scene: Optional callback for each valid scene as it streams in.
+            Scenes may still change if the final storyboard fails validation.
         
     Returns:
         An EnhancedStoryboard object with structured SceneParameters.
@@ -349,12 +438,11 @@ async def generate_enhanced_storyboard(user_input: EnhancedUserInput) -> Enhance
         
     Requirements: 2.1, 2.2, 2.3, 2.4
     """
-    settings = get_settings()
-    client = AsyncOpenAI(api_key=settings.openai_api_key)
+    client = get_openai_client()
     
     user_prompt = build_enhanced_storyboard_prompt(user_input)
     
-    response = await client.chat.completions.create(
+    stream = await client.chat.completions.create(
         model="gpt-4o",
         messages=[
             {"role": "system", "content": ENHANCED_SYSTEM_PROMPT},
@@ -369,11 +457,25 @@ async def generate_enhanced_storyboard(user_input: EnhancedUserInput) -> Enhance
             }
         },
         temperature=0.7,
+        stream=True,
     )
     
-    content = response.choices[0].message.content
+    scanner = _SceneScanner()
+    async for chunk in stream:
+        if not chunk.choices or not chunk.choices[0].delta.content:
+            continue
+        for scene_json in scanner.feed(chunk.choices[0].delta.content):
+            if on_scene is None:
+                continue
+            try:
+                scene = SceneParameters.model_validate_json(scene_json)
+            except ValidationError:
+                continue  # reported by the full validation below
+            on_scene(scene)
+    
+    content = scanner.text
     if not content:
         raise ValueError("OpenAI returned empty response")
     
-    storyboard_data = json.loads(content)
-    return EnhancedStoryboard.model_validate(storyboard_data)
+    # Parse and validate in one pass in pydantic-core
+    return EnhancedStoryboard.model_validate_json(content)
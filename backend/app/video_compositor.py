@@ -18,10 +18,15 @@ from typing import Optional
 
 from pydantic import BaseModel, Field
 
+from app.config import get_settings
 from app.frame_generator import GeneratedFrame, get_dimensions_for_aspect_ratio
 from app.models import Storyboard, Scene, EnhancedStoryboard, SceneParameters
 from typing import Union
 
+settings = get_settings()
+
+# Output frame rate; still-image inputs are read at this rate too
+VIDEO_FPS = 24
 
 class CompositeResult(BaseModel):
     """Result of video compositing operation.
@@ -91,7 +96,8 @@ def build_ffmpeg_command(
     """Build FFmpeg command for video compositing.
     
     Creates a command that:
-    1. Takes each frame as input
+    1. Takes each frame as a looped still-image input, read at the output
+       frame rate and only for its scene's duration
     2. Scales to correct dimensions for aspect ratio
     3. Sets duration for each frame based on scene duration
     4. Applies transition effects between scenes (fade, dissolve, slide)
@@ -111,20 +117,28 @@ def build_ffmpeg_command(
     """
     width, height = get_dimensions_for_aspect_ratio(storyboard.aspect_ratio)
     
-    # Build input arguments - one input per frame
+    # Build input arguments - one input per frame. FFmpeg reads each image
+    # itself; -framerate/-t make the loop produce exactly the frames the
+    # scene needs instead of an endless 25 fps stream.
     inputs = []
-    for frame in frames:
-        inputs.extend(["-loop", "1", "-i", frame.local_path])
+    for frame, scene in zip(frames, storyboard.scenes):
+        inputs.extend([
+            "-loop", "1",
+            "-framerate", str(VIDEO_FPS),
+            "-t", str(scene.duration),
+            "-i", frame.local_path
+        ])
     
     # Build filter complex for scaling and duration
     filter_parts = []
     
     for i, (frame, scene) in enumerate(zip(frames, storyboard.scenes)):
-        # Scale each input to target dimensions and set duration
+        # Fix rate and duration first so scale/pad only run on frames that
+        # are kept, then scale each input to target dimensions
         filter_parts.append(
-            f"[{i}:v]scale={width}:{height}:force_original_aspect_ratio=decrease,"
-            f"pad={width}:{height}:(ow-iw)/2:(oh-ih)/2:black,"
-            f"setsar=1,fps=24,trim=duration={scene.duration},setpts=PTS-STARTPTS[v{i}]"
+            f"[{i}:v]fps={VIDEO_FPS},trim=duration={scene.duration},setpts=PTS-STARTPTS,"
+            f"scale={width}:{height}:force_original_aspect_ratio=decrease,"
+            f"pad={width}:{height}:(ow-iw)/2:(oh-ih)/2:black,setsar=1[v{i}]"
         )
     
     if enable_transitions and len(frames) > 1:
@@ -185,6 +199,7 @@ def build_ffmpeg_command(
         "-map", "[outv]",
         "-c:v", "libx264",
         "-preset", "fast",
+        "-tune", "stillimage",  # every scene is a single still frame
         "-crf", "23",
         "-pix_fmt", "yuv420p",
         "-movflags", "+faststart",  # Enable streaming
@@ -262,7 +277,13 @@ async def composite_video(
             stderr=asyncio.subprocess.PIPE
         )
         
-        stdout, stderr = await process.communicate()
+        try:
+            stdout, stderr = await process.communicate()
+        except asyncio.CancelledError:
+            # Don't leave FFmpeg running for a cancelled job
+            process.kill()
+            await process.wait()
+            raise
         
         if process.returncode != 0:
             error_msg = stderr.decode() if stderr else "Unknown FFmpeg error"
@@ -306,17 +327,28 @@ class VideoCompositorService:
     Provides a high-level interface for compositing videos from frames.
     Manages output directory and video file lifecycle.
     
+    Compositing is the CPU-heavy pipeline stage, so only a limited number
+    of ffmpeg runs execute at once; other jobs wait here while their
+    storyboard and frame stages keep running.
+    
     Attributes:
         base_output_dir: Base directory for storing output videos.
     """
     
-    def __init__(self, base_output_dir: Optional[Path] = None):
+    def __init__(
+        self,
+        base_output_dir: Optional[Path] = None,
+        max_concurrency: Optional[int] = None
+    ):
         """Initialize the video compositor service.
         
         Args:
             base_output_dir: Base directory for video storage.
+            max_concurrency: Maximum concurrent ffmpeg runs. Defaults to
+                the COMPOSITOR_CONCURRENCY setting.
         """
         self.base_output_dir = base_output_dir or Path("/tmp/fabflow")
+        self._slots = asyncio.Semaphore(max_concurrency or settings.compositor_concurrency)
     
     def get_video_output_dir(self, job_id: str) -> Path:
         """Get the output directory for a specific job's video.
@@ -359,7 +391,8 @@ class VideoCompositorService:
         Requirements: 5.1, 5.2, 5.3, 5.5, 5.6
         """
         output_dir = self.get_video_output_dir(job_id)
-        return await composite_video(frames, storyboard, output_dir, job_id)
+        async with self._slots:
+            return await composite_video(frames, storyboard, output_dir, job_id)
     
     def video_exists(self, job_id: str) -> bool:
         """Check if a video file exists for a job.